@@ -5,19 +5,34 @@
 すべてのコンポーネントを統合するメインコントローラー。
 """
 
+import logging
+import os
 import queue
 import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Set, Tuple, Union
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QFileSystemWatcher, QObject, Qt, Signal
 from PySide6.QtWidgets import QApplication
 from pynput import keyboard
 
-from .config import ConfigManager, HotkeyMode, TranscriptionBackend
-from .config.constants import CONFIG_CHECK_INTERVAL_SEC, SAMPLE_RATE
-from .config.types import TranscriptionTask
+from .config import ConfigManager
+from .config.constants import (
+    CONFIG_CHECK_INTERVAL_SEC,
+    CONFIG_RELOAD_DEBOUNCE_SEC,
+    CONFIG_WATCH_FALLBACK_INTERVAL_SEC,
+    HOTKEY_SLOT_KEYS,
+    SAMPLE_RATE,
+)
+from .config.types import (
+    BACKEND_GROQ,
+    BACKEND_OPENAI,
+    HOTKEY_MODE_HOLD,
+    HOTKEY_MODE_TOGGLE,
+    SUPPORTED_BACKENDS,
+    TranscriptionTask,
+)
 from .core import AudioRecorder, GroqTranscriber, InputHandler, OpenAITranscriber
 from .core.audio_preprocess import preprocess as preprocess_audio
 from .platform import get_platform_adapter
@@ -26,6 +41,21 @@ from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 汎用修飾キーから具体的な左右キー名へのマッピング
+_GENERIC_TO_SPECIFIC_MODIFIERS: Dict[str, Tuple[str, str]] = {
+    'ctrl': ('ctrl_l', 'ctrl_r'),
+    'alt': ('alt_l', 'alt_r'),
+    'shift': ('shift_l', 'shift_r'),
+    'cmd': ('cmd_l', 'cmd_r'),
+}
+
+# 左右指定の修飾キーから汎用修飾キーへの逆引き
+_SPECIFIC_TO_GENERIC_MODIFIERS: Dict[str, str] = {
+    specific: generic
+    for generic, pair in _GENERIC_TO_SPECIFIC_MODIFIERS.items()
+    for specific in pair
+}
+
 
 @dataclass
 class HotkeySlot:
@@ -99,6 +129,11 @@ class SuperWhisperApp(QObject):
 
         self._input_handler = InputHandler(platform_adapter=self._platform)
 
+        # テキスト挿入（クリップボード操作・キー送信・待機）は Qt メインスレッドを
+        # ブロックするため、専用の単一コンシューマスレッドで順番に実行する
+        self._input_queue: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._input_worker, daemon=True).start()
+
     def _get_transcriber_for_slot(self, slot: HotkeySlot) -> Optional[Union[GroqTranscriber, OpenAITranscriber]]:
         """
         スロットに対応するTranscriberを取得する。
@@ -125,7 +160,7 @@ class SuperWhisperApp(QObject):
         vad_filter = self._config.get("vad_filter", True)
         vad_min_silence = self._config.get("vad_min_silence_duration_ms", 500)
 
-        if slot.backend == TranscriptionBackend.GROQ.value:
+        if slot.backend == BACKEND_GROQ:
             transcriber = GroqTranscriber(
                 model=slot.api_model,
                 language=language,
@@ -144,7 +179,7 @@ class SuperWhisperApp(QObject):
             logger.info(f"ホットキー{slot.slot_id}: Groq API使用 (モデル={transcriber.model})")
             return transcriber
 
-        elif slot.backend == TranscriptionBackend.OPENAI.value:
+        elif slot.backend == BACKEND_OPENAI:
             transcriber = OpenAITranscriber(
                 model=slot.api_model,
                 language=language,
@@ -221,11 +256,20 @@ class SuperWhisperApp(QObject):
         self._tray = SystemTray(platform_adapter=self._platform)
 
     def _setup_signals(self) -> None:
-        """シグナルをスロットに接続する。"""
+        """シグナルをスロットに接続する。
+
+        status_changed / text_ready はリスナー・ワーカースレッドから emit されるため、
+        AutoConnection の送信元スレッド判定に頼らず QueuedConnection を明示し、
+        スロットが常に Qt メインスレッドで実行されるようにする。
+        """
         self._tray.open_settings.connect(self._open_settings)
         self._tray.quit_app.connect(self._quit_app)
-        self.status_changed.connect(self._update_ui_status)
-        self.text_ready.connect(self._handle_transcription_result)
+        self.status_changed.connect(
+            self._update_ui_status, Qt.ConnectionType.QueuedConnection
+        )
+        self.text_ready.connect(
+            self._handle_transcription_result, Qt.ConnectionType.QueuedConnection
+        )
 
     def _setup_state(self) -> None:
         """アプリケーション状態を初期化する。"""
@@ -276,22 +320,22 @@ class SuperWhisperApp(QObject):
                 except Exception as e:
                     logger.warning(f"旧 transcriber close 失敗 (slot{old_slot.slot_id}): {e}")
 
-        for slot_id in [1, 2]:
-            slot_config = self._config.get(f"hotkey{slot_id}", {})
+        for slot_id, slot_key in HOTKEY_SLOT_KEYS.items():
+            slot_config = self._config.get(slot_key, {})
 
             hotkey = slot_config.get("hotkey", f"<f{slot_id + 1}>")
-            hotkey_mode = slot_config.get("hotkey_mode", HotkeyMode.TOGGLE.value)
-            backend = slot_config.get("backend", "openai")
-            if backend not in [TranscriptionBackend.GROQ.value, TranscriptionBackend.OPENAI.value]:
+            hotkey_mode = slot_config.get("hotkey_mode", HOTKEY_MODE_TOGGLE)
+            backend = slot_config.get("backend", BACKEND_OPENAI)
+            if backend not in SUPPORTED_BACKENDS:
                 logger.warning(
                     f"未対応バックエンド '{backend}' が設定されています。openai にフォールバックします。"
                 )
-                backend = TranscriptionBackend.OPENAI.value
+                backend = BACKEND_OPENAI
             api_model = slot_config.get("api_model", "")
             api_prompt = slot_config.get("api_prompt", "")
 
             # APIモデルのデフォルト値を設定
-            if not api_model and backend in ["groq", "openai"]:
+            if not api_model and backend in SUPPORTED_BACKENDS:
                 defaults = self._config.get("default_api_models", {})
                 api_model = defaults.get(backend, "")
 
@@ -320,7 +364,8 @@ class SuperWhisperApp(QObject):
         )
         self._listener_thread.start()
         
-        # 設定ファイル監視
+        # 設定ファイル監視（OS変更通知を購読し、使えなければポーリング）
+        self._setup_config_watcher()
         self._monitor_thread = threading.Thread(
             target=self._monitor_config,
             daemon=True
@@ -356,6 +401,8 @@ class SuperWhisperApp(QObject):
         """
         logger.info("終了中...")
         self._monitoring = False
+        # 設定監視スレッドの待機を解除
+        self._config_changed_event.set()
 
         # キーボードリスナーを停止（listener.join() のブロックを解除）
         listener = self._listener
@@ -398,10 +445,38 @@ class SuperWhisperApp(QObject):
         if dev_mode:
             text = f'"{text}"'
 
-        logger.info(f"結果: {text}" + (" [auto_enter]" if auto_enter else ""))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"結果: {text}" + (" [auto_enter]" if auto_enter else ""))
+
+        # 実際の挿入は入力ワーカースレッドに委ねる（UIスレッドをブロックしない）
+        self._input_queue.put((text, auto_enter, dev_mode))
 
+    def _input_worker(self) -> None:
+        """テキスト挿入キューを順番に処理するワーカー。
+
+        個別の挿入で例外が出てもワーカーが止まらないよう、1件ずつ握って継続する。
+        """
+        while True:
+            text, auto_enter, dev_mode = self._input_queue.get()
+            try:
+                self._insert_result_text(text, auto_enter, dev_mode)
+            except Exception as e:
+                logger.exception(f"テキスト挿入処理で例外発生: {e}")
+
+    def _insert_result_text(self, text: str, auto_enter: bool, dev_mode: bool) -> None:
+        """
+        文字起こし結果をアクティブウィンドウへ挿入する（入力ワーカースレッドで実行）。
+
+        Args:
+            text: 挿入するテキスト
+            auto_enter: Trueの場合、テキスト挿入後にEnterキーを自動送信
+            dev_mode: Trueの場合、タイミングをファイルに記録
+        """
         insert_start = time.perf_counter()
-        self._input_handler.insert_text(text)
+        self._input_handler.insert_text(
+            text,
+            type_ascii_directly=bool(self._config.get("type_ascii_directly", False)),
+        )
         insert_time = (time.perf_counter() - insert_start) * 1000
 
         # ダブルタップモード：テキスト挿入後にEnterキーを自動送信
@@ -632,7 +707,7 @@ class SuperWhisperApp(QObject):
             try:
                 # いずれかのスロットがHoldモードの場合は低レベルリスナーを使用
                 has_hold_mode = any(
-                    slot.hotkey_mode == HotkeyMode.HOLD.value
+                    slot.hotkey_mode == HOTKEY_MODE_HOLD
                     for slot in self._hotkey_slots.values()
                 )
 
@@ -684,34 +759,45 @@ class SuperWhisperApp(QObject):
         ダブルタップ検出：前回のリリースから短時間内に同じスロットの
         ホットキーが押された場合、auto_enterモードで録音を開始する。
 
+        キー正規化は例外を投げないため、例外ガードは録音開始呼び出しのみに
+        限定し、通常キーの経路には置かない。
+
         Args:
             key: 押されたキー
         """
-        try:
-            key_str = self._normalize_key(key)
-            if key_str is None:
-                # 正規化失敗キーは無視（後で発見できるよう debug ログだけ残す）
+        key_str = self._normalize_key(key)
+        if key_str is None:
+            # 正規化失敗キーは無視（後で発見できるよう debug ログだけ残す）
+            # キー毎に通る経路のため、DEBUG 無効時は repr/f-string を組み立てない
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"キー正規化に失敗（無視）: {key!r}")
-                return
+            return
 
-            self._pressed_keys.add(key_str)
-            # 録音中でなければ、どのスロットのホットキーかチェック
-            if not self._is_recording:
-                for slot_id, slot in self._hotkey_slots.items():
-                    if self._check_hotkey_match_for_slot(slot):
-                        # ダブルタップ検出：同じスロットで短時間内の再押下
-                        now = time.perf_counter()
-                        if (self._last_hotkey_release_slot == slot_id
-                                and (now - self._last_hotkey_release_time) < self._double_tap_window_sec):
-                            self._auto_enter_active = True
-                            logger.info(f"ダブルタップ検出 (スロット{slot_id}) - auto_enterモード")
-                        else:
-                            self._auto_enter_active = False
-                        self.start_recording(slot_id)
-                        break
-        except Exception as e:
-            # ハンドラ内例外を握り潰すとリスナーが止まるため必ず復帰
-            logger.exception(f"キー押下処理で例外: {e}")
+        self._pressed_keys.add(key_str)
+        # 録音中なら開始判定は不要（属性1回の参照で打ち切る）
+        if self._is_recording:
+            return
+
+        # 押されたキーを含むスロットだけ一致判定する。
+        # 通常のタイピングでは O(1) の所属チェックで全スロットを素通りする
+        for slot_id, slot in self._hotkey_slots.items():
+            if not self._is_hotkey_key_for_slot(key_str, slot):
+                continue
+            if self._check_hotkey_match_for_slot(slot):
+                # ダブルタップ検出：同じスロットで短時間内の再押下
+                now = time.perf_counter()
+                if (self._last_hotkey_release_slot == slot_id
+                        and (now - self._last_hotkey_release_time) < self._double_tap_window_sec):
+                    self._auto_enter_active = True
+                    logger.info(f"ダブルタップ検出 (スロット{slot_id}) - auto_enterモード")
+                else:
+                    self._auto_enter_active = False
+                try:
+                    self.start_recording(slot_id)
+                except Exception as e:
+                    # ハンドラ内例外が伝播するとリスナーが止まるため必ず復帰
+                    logger.exception(f"キー押下処理で例外: {e}")
+                break
 
     def _handle_key_release(self, key: Any) -> None:
         """
@@ -724,26 +810,31 @@ class SuperWhisperApp(QObject):
         Args:
             key: 解放されたキー
         """
-        try:
-            key_str = self._normalize_key(key)
-            if key_str is None:
+        key_str = self._normalize_key(key)
+        if key_str is None:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"キー正規化に失敗（無視）: {key!r}")
-                # 保険：押下キーが空なのに録音中の場合は停止（永久録音防止）
-                if self._is_recording and not self._pressed_keys:
-                    logger.warning("正規化失敗時に押下キー無し＋録音中を検出 → 安全のため停止")
-                    self.stop_and_transcribe()
-                return
+            # 保険：押下キーが空なのに録音中の場合は停止（永久録音防止）
+            if self._is_recording and not self._pressed_keys:
+                logger.warning("正規化失敗時に押下キー無し＋録音中を検出 → 安全のため停止")
+                self._stop_from_listener()
+            return
 
-            if key_str in self._pressed_keys:
-                self._pressed_keys.remove(key_str)
-            # ホットキーに含まれるキーが離されたら録音停止
-            if self._is_recording and self._active_slot is not None:
-                active_slot = self._hotkey_slots[self._active_slot]
-                if self._is_hotkey_key_released_for_slot(key_str, active_slot):
-                    # ダブルタップ検出用にリリース時刻とスロットを記録
-                    self._last_hotkey_release_time = time.perf_counter()
-                    self._last_hotkey_release_slot = self._active_slot
-                    self.stop_and_transcribe()
+        self._pressed_keys.discard(key_str)
+        # ホットキーに含まれるキーが離されたら録音停止
+        if not self._is_recording:
+            return
+        active_slot = self._hotkey_slots.get(self._active_slot)
+        if active_slot is not None and self._is_hotkey_key_released_for_slot(key_str, active_slot):
+            # ダブルタップ検出用にリリース時刻とスロットを記録
+            self._last_hotkey_release_time = time.perf_counter()
+            self._last_hotkey_release_slot = active_slot.slot_id
+            self._stop_from_listener()
+
+    def _stop_from_listener(self) -> None:
+        """リスナースレッドから録音を停止する（例外でリスナーを止めない）。"""
+        try:
+            self.stop_and_transcribe()
         except Exception as e:
             logger.exception(f"キー解放処理で例外: {e}")
 
@@ -751,10 +842,23 @@ class SuperWhisperApp(QObject):
         """
         解放されたキーが指定スロットのホットキーの一部かチェックする。
 
+        Args:
+            key_str: 解放されたキー文字列
+            slot: チェック対象のスロット
+
+        Returns:
+            ホットキーの一部の場合True
+        """
+        return self._is_hotkey_key_for_slot(key_str, slot)
+
+    def _is_hotkey_key_for_slot(self, key_str: str, slot: HotkeySlot) -> bool:
+        """
+        キーが指定スロットのホットキーを構成するキーかチェックする。
+
         汎用修飾キー（ctrl, alt, shift）の場合は対応する左右キーも確認。
 
         Args:
-            key_str: 解放されたキー文字列
+            key_str: 押下・解放されたキー文字列
             slot: チェック対象のスロット
 
         Returns:
@@ -765,14 +869,7 @@ class SuperWhisperApp(QObject):
             return True
 
         # 汎用修飾キーへのマッピングをチェック
-        specific_to_generic = {
-            'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
-            'alt_l': 'alt', 'alt_r': 'alt',
-            'shift_l': 'shift', 'shift_r': 'shift',
-            'cmd_l': 'cmd', 'cmd_r': 'cmd',
-        }
-
-        generic_key = specific_to_generic.get(key_str)
+        generic_key = _SPECIFIC_TO_GENERIC_MODIFIERS.get(key_str)
         if generic_key and generic_key in slot.required_keys:
             return True
 
@@ -789,7 +886,7 @@ class SuperWhisperApp(QObject):
             key: 正規化するキー
             
         Returns:
-            正規化されたキー文字列、または失敗時None
+            正規化されたキー文字列、または失敗時None（例外は送出しない）
         """
         return self._platform.normalize_listener_key(key)
 
@@ -829,18 +926,10 @@ class SuperWhisperApp(QObject):
         Returns:
             ホットキーが一致した場合True
         """
-        # 汎用修飾キーから具体的な左右キー名へのマッピング
-        generic_to_specific = {
-            'ctrl': ('ctrl_l', 'ctrl_r'),
-            'alt': ('alt_l', 'alt_r'),
-            'shift': ('shift_l', 'shift_r'),
-            'cmd': ('cmd_l', 'cmd_r'),
-        }
-
         for required_key in slot.required_keys:
-            if required_key in generic_to_specific:
+            if required_key in _GENERIC_TO_SPECIFIC_MODIFIERS:
                 # 汎用キー: 左右どちらかが押されていればOK
-                left, right = generic_to_specific[required_key]
+                left, right = _GENERIC_TO_SPECIFIC_MODIFIERS[required_key]
                 if left not in self._pressed_keys and right not in self._pressed_keys:
                     return False
             else:
@@ -854,12 +943,61 @@ class SuperWhisperApp(QObject):
     # 設定監視
     # -------------------------------------------------------------------------
 
+    def _setup_config_watcher(self) -> None:
+        """
+        設定ファイルの OS 変更通知を購読する。
+
+        QFileSystemWatcher（inotify / ReadDirectoryChangesW / FSEvents）で
+        ファイルと親ディレクトリを監視し、通知で監視スレッドを起こす。
+        ディレクトリも監視するのは、エディタの置き換え保存（rename）で
+        ファイル側の監視が外れるケースに対応するため。
+        監視を登録できない環境では従来の周期ポーリングにフォールバックする。
+        """
+        self._config_changed_event = threading.Event()
+        self._config_watcher = QFileSystemWatcher(self)
+
+        config_path = self._config.config_path
+        config_dir = os.path.dirname(os.path.abspath(config_path))
+        watch_paths = [config_dir]
+        if os.path.exists(config_path):
+            watch_paths.append(config_path)
+
+        failed = self._config_watcher.addPaths(watch_paths)
+        self._config_watch_enabled = config_dir not in failed
+        if not self._config_watch_enabled:
+            logger.warning("設定ファイルの変更通知を登録できません。ポーリング監視を使用します。")
+            return
+
+        self._config_watcher.fileChanged.connect(self._on_config_path_changed)
+        self._config_watcher.directoryChanged.connect(self._on_config_path_changed)
+
+    def _on_config_path_changed(self, _path: str) -> None:
+        """設定ファイル/ディレクトリの変更通知を受けて監視スレッドを起こす。"""
+        # 置き換え保存でファイル監視が外れた場合は再登録
+        config_path = self._config.config_path
+        if config_path not in self._config_watcher.files() and os.path.exists(config_path):
+            self._config_watcher.addPath(config_path)
+        self._config_changed_event.set()
+
     def _monitor_config(self) -> None:
         """設定ファイルの変更を監視する。"""
         while self._monitoring:
-            time.sleep(CONFIG_CHECK_INTERVAL_SEC)
+            if self._config_watch_enabled:
+                # 変更通知まで待機（通知の取りこぼしに備えて長周期でも確認）
+                self._config_changed_event.wait(CONFIG_WATCH_FALLBACK_INTERVAL_SEC)
+                self._config_changed_event.clear()
+                # 連続書き込みの通知をまとめてから確認する
+                time.sleep(CONFIG_RELOAD_DEBOUNCE_SEC)
+            else:
+                time.sleep(CONFIG_CHECK_INTERVAL_SEC)
             
-            if self._config.reload_if_changed():
+            reloaded = self._config.reload_if_changed()
+            # 書き込み直後で保留された場合は、次の通知・ポーリングを待たずに間隔を空けて再確認する
+            while not reloaded and self._monitoring and self._config.reload_pending:
+                time.sleep(CONFIG_RELOAD_DEBOUNCE_SEC)
+                reloaded = self._config.reload_if_changed()
+
+            if reloaded:
                 self._apply_config_changes()
                 logger.info("設定を再読み込みして適用しました。")
 
@@ -877,13 +1015,13 @@ class SuperWhisperApp(QObject):
 
         # ホットキースロット設定を更新
         slots_changed = False
-        for slot_id in [1, 2]:
-            slot_config = self._config.get(f"hotkey{slot_id}", {})
+        for slot_id, slot_key in HOTKEY_SLOT_KEYS.items():
+            slot_config = self._config.get(slot_key, {})
             new_hotkey = slot_config.get("hotkey", f"<f{slot_id + 1}>")
-            new_mode = slot_config.get("hotkey_mode", HotkeyMode.TOGGLE.value)
-            new_backend = slot_config.get("backend", "openai")
-            if new_backend not in [TranscriptionBackend.GROQ.value, TranscriptionBackend.OPENAI.value]:
-                new_backend = TranscriptionBackend.OPENAI.value
+            new_mode = slot_config.get("hotkey_mode", HOTKEY_MODE_TOGGLE)
+            new_backend = slot_config.get("backend", BACKEND_OPENAI)
+            if new_backend not in SUPPORTED_BACKENDS:
+                new_backend = BACKEND_OPENAI
             new_api_model = slot_config.get("api_model", "")
             new_api_prompt = slot_config.get("api_prompt", "")
 
@@ -6,42 +6,106 @@ YAMLファイルからの設定読み込み、保存、ホットリロードを
 """
 
 import os
+import pickle
 import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Optional, Tuple
 
 from ..utils.logger import get_logger
-from .constants import DEFAULT_CONFIG, SETTINGS_FILE_NAME
+from .constants import (
+    DEFAULT_CONFIG,
+    HOTKEY_SLOT_KEYS,
+    SETTINGS_FILE_NAME,
+)
 
 logger = get_logger(__name__)
 API_BACKENDS = {"groq", "openai"}
 
+# 旧形式（単一ホットキー + バックエンド別API設定）のキー
+_LEGACY_API_KEYS: Tuple[str, ...] = (
+    "groq_model",
+    "openai_model",
+    "groq_prompt",
+    "openai_prompt",
+    "transcription_backend",
+)
+
+# 廃止したローカル推論設定のキー
+_REMOVED_LOCAL_KEYS: Tuple[str, ...] = (
+    "model_size",
+    "compute_type",
+    "release_memory_delay",
+    "condition_on_previous_text",
+    "no_speech_threshold",
+    "log_prob_threshold",
+    "no_speech_prob_cutoff",
+    "beam_size",
+    "model_cache_dir",
+    "local_backend",
+)
+
+# いずれかが含まれていればマイグレーションが必要なキー
+_LEGACY_KEYS: frozenset = frozenset(("hotkey",) + _LEGACY_API_KEYS + _REMOVED_LOCAL_KEYS)
+
+# パース済み設定キャッシュの最大エントリ数
+PARSE_CACHE_MAX_ENTRIES: int = 8
+
+# DEFAULT_CONFIG の pickle 済みテンプレート。
+# 組み込み型（dict/str/int/bool）のみで構成されるため、pickle.loads による
+# C 実装の再構築で copy.deepcopy より高速に独立した複製を作れる
+_DEFAULT_CONFIG_BLOB: bytes = pickle.dumps(DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@lru_cache(maxsize=1)
+def _get_yaml() -> Tuple[Any, Any, Any]:
+    """
+    PyYAML を初回使用時に import し、(モジュール, Loader, Dumper) を返す。
+
+    設定ファイルが無い初回起動などでは import 自体を省き、起動を軽くする。
+    libyaml（C実装）のローダー/ダンパーを優先し、未ビルド環境では純Python実装にフォールバック。
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _clone_default_config() -> Dict[str, Any]:
+    """ネストされた辞書も含めて独立した DEFAULT_CONFIG の複製を返す。"""
+    return pickle.loads(_DEFAULT_CONFIG_BLOB)
+
 
 def _deep_merge(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
     """
-    2つの辞書を深くマージする。
+    updatesの内容をbaseへ深くマージする（baseをその場で更新する）。
 
     updatesの値がbaseの値を上書きする。
-    ネストされた辞書も再帰的にマージされる。
+    ネストされた辞書も明示スタックで反復的にマージされ、
+    階層ごとの辞書コピーや再帰呼び出しは発生しない。
 
     Args:
-        base: ベースとなる辞書
+        base: マージ先の辞書（呼び出し側が所有する複製を渡すこと）
         updates: 更新値を含む辞書
 
     Returns:
-        マージされた辞書
+        マージ後のbase
     """
-    result = base.copy()
-    for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # 両方が辞書の場合は再帰的にマージ
-            result[key] = _deep_merge(result[key], value)
-        else:
-            # それ以外は上書き
-            result[key] = value
-    return result
+    stack = [(base, updates)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                # 両方が辞書の場合は下の階層もマージ
+                stack.append((current, value))
+            else:
+                # それ以外は上書き
+                dst[key] = value
+    return base
 
 
 class ConfigManager:
@@ -55,6 +119,12 @@ class ConfigManager:
         config_path: 設定ファイルのパス
         config: 現在の設定辞書
     """
+
+    # (パス, mtime_ns, サイズ) → マージ済み設定（pickle） の LRU キャッシュ（インスタンス間で共有）
+    # アプリ本体と設定ウィンドウが同じファイルを読む際の再パースを省く
+    _parse_cache: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+    # 監視スレッドと UI スレッドの両方から参照・更新されるため、参照〜追加〜追い出しを保護する
+    _parse_cache_lock = threading.Lock()
     
     def __init__(self, config_path: Optional[str] = None) -> None:
         """
@@ -64,7 +134,13 @@ class ConfigManager:
             config_path: 設定ファイルのパス。Noneの場合はプロジェクトルートから自動検索
         """
         self.config_path = self._resolve_config_path(config_path)
-        self.last_mtime: Optional[float] = None  # ファイル更新時刻
+        # ファイル更新時刻（ナノ秒整数。float の精度落ちや秒単位丸めの影響を受けない）
+        self.last_mtime_ns: Optional[int] = None
+        # ファイルサイズ。mtime_ns と組で変更を検出する（1回の stat で取得できる値のみ）
+        self._last_size: Optional[int] = None
+        # 変更を検出したが再読み込みを保留している (mtime_ns, サイズ)。
+        # 次回のチェックで同じ値なら書き込み完了とみなして読み込む
+        self._pending_stat: Optional[Tuple[int, int]] = None
         self.config: Dict[str, Any] = self._load_config()
 
     def _resolve_config_path(self, config_path: Optional[str]) -> str:
@@ -94,6 +170,10 @@ class ConfigManager:
         Returns:
             マイグレーション済みの設定辞書
         """
+        # 新形式かつ正規化済みの設定（通常のホットリロード）はそのまま返す
+        if self._is_current_format(config):
+            return config
+
         if "hotkey" in config and "hotkey1" not in config:
             # 旧形式を検出
             logger.info("旧設定フォーマットを検出。新形式にマイグレーション中...")
@@ -115,31 +195,14 @@ class ConfigManager:
             config["hotkey2"] = DEFAULT_CONFIG["hotkey2"].copy()
 
             # 旧キーを削除
-            for key in [
-                "groq_model",
-                "openai_model",
-                "groq_prompt",
-                "openai_prompt",
-                "transcription_backend",
-                "model_size",
-                "compute_type",
-                "release_memory_delay",
-                "condition_on_previous_text",
-                "no_speech_threshold",
-                "log_prob_threshold",
-                "no_speech_prob_cutoff",
-                "beam_size",
-                "model_cache_dir",
-                "local_backend",
-            ]:
+            for key in _LEGACY_API_KEYS + _REMOVED_LOCAL_KEYS:
                 config.pop(key, None)
 
             logger.info("設定マイグレーション完了")
 
         # スロット設定が存在する場合は、API専用バックエンドに正規化
         defaults = DEFAULT_CONFIG.get("default_api_models", {})
-        for slot_id in [1, 2]:
-            slot_key = f"hotkey{slot_id}"
+        for slot_key in HOTKEY_SLOT_KEYS.values():
             slot = config.get(slot_key)
             if not isinstance(slot, dict):
                 continue
@@ -152,22 +215,33 @@ class ConfigManager:
                 slot["api_model"] = defaults.get(backend, "")
 
         # 廃止したローカル推論設定キーを削除
-        for key in [
-            "local_backend",
-            "model_size",
-            "compute_type",
-            "release_memory_delay",
-            "condition_on_previous_text",
-            "no_speech_threshold",
-            "log_prob_threshold",
-            "no_speech_prob_cutoff",
-            "beam_size",
-            "model_cache_dir",
-        ]:
+        for key in _REMOVED_LOCAL_KEYS:
             config.pop(key, None)
 
         return config
 
+    @staticmethod
+    def _is_current_format(config: Dict[str, Any]) -> bool:
+        """
+        マイグレーション・正規化が不要な新形式の設定かを判定する。
+
+        旧キーを1つも含まず、各スロットのバックエンドが有効値で
+        APIモデルが設定済みであればTrueを返す。
+        """
+        if not _LEGACY_KEYS.isdisjoint(config):
+            return False
+
+        for slot_key in HOTKEY_SLOT_KEYS.values():
+            slot = config.get(slot_key)
+            if not isinstance(slot, dict):
+                continue
+            if slot.get("backend") not in API_BACKENDS:
+                return False
+            if not str(slot.get("api_model", "") or "").strip():
+                return False
+
+        return True
+
     @staticmethod
     def _normalize_backend(backend: Any) -> str:
         """
@@ -187,47 +261,97 @@ class ConfigManager:
         Returns:
             すべてのキーが保証された設定辞書
         """
-        if not os.path.exists(self.config_path):
+        # 存在確認と更新時刻取得を1回の stat で行う（EAFP、TOCTOU も回避）
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
             logger.warning(f"設定ファイルが見つかりません: {self.config_path}。デフォルト値を使用します。")
-            return DEFAULT_CONFIG.copy()
+            return _clone_default_config()
+        except OSError as e:
+            logger.error(f"設定読み込みエラー: {e}")
+            return _clone_default_config()
 
         try:
-            self.last_mtime = os.path.getmtime(self.config_path)
-
+            self._record_stat(st)
+
+            # 内容が同一（mtime・サイズが一致）なら前回のパース結果を再利用
+            cache_key = (self.config_path, st.st_mtime_ns, st.st_size)
+            with self._parse_cache_lock:
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None:
+                    self._parse_cache.move_to_end(cache_key)
+            if cached is not None:
+                return pickle.loads(cached)
+
+            yaml, yaml_loader, _ = _get_yaml()
             with open(self.config_path, "r", encoding="utf-8") as f:
-                loaded_config = yaml.safe_load(f) or {}
+                loaded_config = yaml.load(f, Loader=yaml_loader) or {}
 
             # 旧形式の設定をマイグレーション
             loaded_config = self._migrate_legacy_config(loaded_config)
 
             # デフォルト設定と深くマージ（ネストされた辞書も保証）
-            config = _deep_merge(DEFAULT_CONFIG, loaded_config)
+            config = _deep_merge(_clone_default_config(), loaded_config)
+
+            # 呼び出し側が設定を変更してもキャッシュが汚れないよう pickle 化して保持
+            pickled = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._parse_cache_lock:
+                self._parse_cache[cache_key] = pickled
+                while len(self._parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+                    self._parse_cache.popitem(last=False)
             return config
 
         except Exception as e:
             logger.error(f"設定読み込みエラー: {e}")
-            return DEFAULT_CONFIG.copy()
+            return _clone_default_config()
+
+    def _record_stat(self, st: os.stat_result) -> None:
+        """読み込み・保存したファイルの変更検出キー（mtime_ns, サイズ）を記録する。"""
+        self.last_mtime_ns = st.st_mtime_ns
+        self._last_size = st.st_size
+        self._pending_stat = None
+
+    @property
+    def reload_pending(self) -> bool:
+        """変更を検出し、書き込み完了の確認待ちで再読み込みを保留しているか。"""
+        return self._pending_stat is not None
 
     def reload_if_changed(self) -> bool:
         """
         ファイルが変更されていれば設定を再読み込みする。
+
+        stat は1回のみ行い、(mtime_ns, サイズ) の組で変更を検出する。
+        変更を初めて検出した回は書き込み途中の可能性があるため保留し、
+        次回のチェックで同じ (mtime_ns, サイズ) のままなら再読み込みする。
+        壁時計と mtime を比較しないため、mtime の粒度が粗いファイルシステムや
+        時計のずれ・未来の mtime でも保留が解消される。
         
         Returns:
             再読み込みした場合True、しなかった場合False
         """
-        if not os.path.exists(self.config_path):
-            return False
-            
         try:
-            current_mtime = os.path.getmtime(self.config_path)
-            if self.last_mtime is None or current_mtime > self.last_mtime:
-                logger.info("設定ファイルが変更されました。再読み込み中...")
-                self.config = self._load_config()
-                return True
-        except Exception as e:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            self._pending_stat = None
+            return False
+        except OSError as e:
             logger.error(f"設定確認エラー: {e}")
-            
-        return False
+            self._pending_stat = None
+            return False
+
+        if st.st_mtime_ns == self.last_mtime_ns and st.st_size == self._last_size:
+            self._pending_stat = None
+            return False
+
+        # 連続書き込みの途中で読まないよう、前回のチェックから変化が止まるまで保留
+        current_stat = (st.st_mtime_ns, st.st_size)
+        if current_stat != self._pending_stat:
+            self._pending_stat = current_stat
+            return False
+
+        logger.info("設定ファイルが変更されました。再読み込み中...")
+        self.config = self._load_config()
+        return True
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -245,6 +369,9 @@ class ConfigManager:
     def save(self, new_config: Dict[str, Any]) -> bool:
         """
         設定をファイルに保存する。
+
+        一時ファイルに書き出してから os.replace で置き換えるため、
+        監視側が書き込み途中の不完全なファイルを読むことはない。
         
         Args:
             new_config: 新しい設定値を含む辞書
@@ -256,12 +383,30 @@ class ConfigManager:
             # 内部設定を更新
             self.config.update(new_config)
             
-            # ファイルに書き込み
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
+            # 同じディレクトリの一時ファイルに書き込み、アトミックに置き換える
+            # （同一ボリューム内の os.replace は Windows / POSIX ともにアトミック）
+            yaml, _, yaml_dumper = _get_yaml()
+            tmp_path = f"{self.config_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    yaml.dump(
+                        self.config,
+                        f,
+                        Dumper=yaml_dumper,
+                        default_flow_style=False,
+                        allow_unicode=True,
+                    )
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                # 失敗時は一時ファイルを残さない（元の設定ファイルは無傷）
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
             
-            # 再読み込みループを防ぐために更新時刻を記録
-            self.last_mtime = os.path.getmtime(self.config_path)
+            # 自身の保存で再読み込みしないよう、保存後のファイル状態を記録
+            self._record_stat(os.stat(self.config_path))
             logger.info("設定を保存しました。")
             return True
             
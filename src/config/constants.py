@@ -7,7 +7,7 @@ settings.yamlが存在しない場合のデフォルト設定を定義する。
 
 from typing import Any, Dict
 
-from .types import HotkeyMode
+from .types import BACKEND_GROQ, BACKEND_OPENAI, HOTKEY_MODE_TOGGLE
 
 # ============================================
 # アプリケーションメタデータ
@@ -20,12 +20,23 @@ APP_VERSION: str = "1.0.0"
 # ============================================
 SAMPLE_RATE: int = 16000      # サンプリングレート（Hz）
 AUDIO_CHANNELS: int = 1       # チャンネル数（モノラル）
-AUDIO_DTYPE: str = "float32"  # 音声データ型
+AUDIO_DTYPE: str = "int16"  # キャプチャ時の音声データ型（停止時に float32 へ変換）
 
 # ============================================
 # タイミング設定
 # ============================================
 CONFIG_CHECK_INTERVAL_SEC: int = 1          # 設定ファイル監視間隔（秒）
+CONFIG_RELOAD_DEBOUNCE_SEC: float = 0.3     # 変更検出後、この間隔で再確認し stat が変わらなければ再読み込み（秒）
+CONFIG_WATCH_FALLBACK_INTERVAL_SEC: int = 60  # OS変更通知使用時の取りこぼし対策の確認間隔（秒）
+# ============================================
+# ホットキースロット
+# ============================================
+# スロットID → 設定キー。呼び出し毎に f"hotkey{slot_id}" を生成せず同一の文字列を使う
+HOTKEY_SLOT_KEYS: Dict[int, str] = {
+    1: "hotkey1",
+    2: "hotkey2",
+}
+
 # ============================================
 # デフォルト設定
 # ============================================
@@ -40,8 +51,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     # ホットキー1 設定
     "hotkey1": {
         "hotkey": "<f2>",
-        "hotkey_mode": HotkeyMode.TOGGLE.value,
-        "backend": "openai",
+        "hotkey_mode": HOTKEY_MODE_TOGGLE,
+        "backend": BACKEND_OPENAI,
         "api_model": "",
         "api_prompt": "",
     },
@@ -49,8 +60,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     # ホットキー2 設定
     "hotkey2": {
         "hotkey": "<f3>",
-        "hotkey_mode": HotkeyMode.TOGGLE.value,
-        "backend": "groq",
+        "hotkey_mode": HOTKEY_MODE_TOGGLE,
+        "backend": BACKEND_GROQ,
         "api_model": "",
         "api_prompt": "",
     },
@@ -71,6 +82,11 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     # 一部アプリは即座のEnterに反応しないため調整可能にする
     "auto_enter_delay_ms": 50,
 
+    # ASCII のみの短い結果はクリップボードを経由せずキー入力で挿入する
+    # （クリップボード内容を上書きしない・貼り付け待機が無い）。
+    # 日本語 IME が有効なウィンドウでは入力が変換されてしまうため既定は無効
+    "type_ascii_directly": False,
+
     # 音声前処理（API送信前）
     # volume_normalize: Peak+RMS ハイブリッド正規化（目標 -20 dBFS、ピーク -3 dBFS）
     # ノイズ対策は API モデル側に任せるため、ここでは音量のみ調整する
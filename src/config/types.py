@@ -3,11 +3,26 @@
 
 アプリケーション設定で使用される列挙型とデータクラスを定義する。
 型安全な設定管理のための基盤を提供する。
+
+データクラスは slots + frozen（不変）で定義しているため、
+値を変更する場合は dataclasses.replace() で新しいインスタンスを作成する。
+NumPy 配列を保持する TranscriptionTask は eq=False とし、同一性で比較・ハッシュする。
 """
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final, FrozenSet
+
+# ホットパスの判定・既定値で使用する文字列定数
+# （Enum の .value 参照を避け、比較を単純な文字列比較にする）
+HOTKEY_MODE_TOGGLE: Final[str] = "toggle"
+HOTKEY_MODE_HOLD: Final[str] = "hold"
+
+BACKEND_GROQ: Final[str] = "groq"
+BACKEND_OPENAI: Final[str] = "openai"
+
+# 対応バックエンドの集合（設定値の妥当性チェック用）
+SUPPORTED_BACKENDS: Final[FrozenSet[str]] = frozenset((BACKEND_GROQ, BACKEND_OPENAI))
 
 
 class HotkeyMode(str, Enum):
@@ -18,8 +33,8 @@ class HotkeyMode(str, Enum):
         TOGGLE: トグルモード - 1回押して開始、もう1回押して停止
         HOLD: ホールドモード - 押している間録音、離すと停止
     """
-    TOGGLE = "toggle"
-    HOLD = "hold"
+    TOGGLE = HOTKEY_MODE_TOGGLE
+    HOLD = HOTKEY_MODE_HOLD
 
 
 class AppState(str, Enum):
@@ -42,15 +57,18 @@ class TranscriptionBackend(str, Enum):
         GROQ: Groq Cloud API
         OPENAI: OpenAI GPT-4o Transcribe API
     """
-    GROQ = "groq"
-    OPENAI = "openai"
+    GROQ = BACKEND_GROQ
+    OPENAI = BACKEND_OPENAI
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class TranscriptionTask:
     """
     キューに入れる文字起こしタスク。
 
+    audio_data の NumPy 配列は値比較・ハッシュができないため、
+    生成される __eq__ / __hash__ を使わず同一性で扱う（eq=False）。
+
     Attributes:
         audio_data: 音声データ（NumPy配列）
         slot_id: 使用するホットキースロットID
@@ -63,7 +81,7 @@ class TranscriptionTask:
     auto_enter: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriberConfig:
     """
     文字起こしモジュールの共通設定。
@@ -73,14 +91,14 @@ class TranscriberConfig:
     vad_min_silence_duration_ms: int = 500
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HotkeyConfig:
     """ホットキー設定。"""
     hotkey: str = "<f2>"
-    hotkey_mode: str = HotkeyMode.TOGGLE.value
+    hotkey_mode: str = HOTKEY_MODE_TOGGLE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HotkeySlotConfig:
     """
     個別ホットキースロットの設定。
@@ -96,13 +114,13 @@ class HotkeySlotConfig:
         api_prompt: APIバックエンド使用時のプロンプト
     """
     hotkey: str = "<f2>"
-    hotkey_mode: str = HotkeyMode.TOGGLE.value
-    backend: str = TranscriptionBackend.OPENAI.value
+    hotkey_mode: str = HOTKEY_MODE_TOGGLE
+    backend: str = BACKEND_OPENAI
     api_model: str = ""
     api_prompt: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """
     アプリケーション全体の設定。
@@ -111,7 +129,7 @@ class AppConfig:
     """
     # ホットキー設定
     hotkey: str = "<f2>"
-    hotkey_mode: str = HotkeyMode.TOGGLE.value
+    hotkey_mode: str = HOTKEY_MODE_TOGGLE
     
     # 共通設定
     language: str = "ja"
@@ -5,20 +5,37 @@ sounddeviceライブラリを使用してマイクから音声を録音する機
 録音データはNumPy配列として返され、Whisperによる文字起こしに使用される。
 """
 
-import queue
+import math
 import threading
-from typing import Any, Dict, List, Optional, Union
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
-import sounddevice as sd
 
 from ..config.constants import SAMPLE_RATE, AUDIO_CHANNELS, AUDIO_DTYPE
 from ..utils.logger import get_logger
+from .audio_utils import prewarm_mp3_encoder
+
+if TYPE_CHECKING:
+    import sounddevice as sd
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_sounddevice():
+    """
+    sounddevice を初回使用時に読み込む。
+
+    PortAudio ネイティブライブラリのロードを、実際にマイクやデバイス一覧が
+    必要になるまで遅延させる。
+    """
+    import sounddevice
+    return sounddevice
+
+
 class AudioRecorder:
     """
     音声録音を管理するクラス。
@@ -31,6 +48,25 @@ class AudioRecorder:
         sample_rate: サンプリングレート（Hz）
         is_recording: 録音中かどうか
     """
+
+    # 録音バッファの初期確保長（秒）。超えた場合は倍々で拡張する
+    _INITIAL_BUFFER_SECONDS: int = 30
+
+    # 音声レベル正規化係数（0.0-1.0）- 最大RMSを0.3程度と仮定し、除算を乗算に置き換える
+    _LEVEL_SCALE: float = 1.0 / 0.3
+
+    # 音声レベル通知の最小間隔（秒）。UIメーターには 20Hz 程度で十分なため、
+    # それより速いコールバックでは二乗和を累積して間引く
+    _LEVEL_EMIT_INTERVAL_SEC: float = 0.05
+
+    # int16 PCM を float32 [-1.0, 1.0) に変換する係数
+    _INT16_TO_FLOAT: float = 1.0 / 32768.0
+
+    # 入力デバイス一覧のキャッシュ。全インスタンスで共有し、invalidate_device_cache() まで保持する
+    # （PortAudio への問い合わせは Windows で数百ミリ秒かかることがあり、
+    # また PortAudio は再初期化までデバイス構成を再走査しないため、再取得しても結果は変わらない）
+    _device_cache: Optional[List[Dict[str, Any]]] = None
+    _device_cache_lock = threading.Lock()
     
     def __init__(
         self,
@@ -45,9 +81,14 @@ class AudioRecorder:
             input_device: 入力デバイス（"default" / デバイスID / デバイス名）
         """
         self.sample_rate = sample_rate
-        self._queue: queue.Queue = queue.Queue()  # 録音データを一時保存するキュー
+        # 録音データ（int16 PCM）を書き込む事前確保バッファと書き込み位置
+        # （コールバック毎のコピー生成・キュー投入と、停止時の concatenate を不要にする）
+        self._buffer: npt.NDArray[np.int16] = np.empty(
+            self._INITIAL_BUFFER_SECONDS * sample_rate, dtype=np.int16
+        )
+        self._write_idx = 0
         self._recording = False  # 録音状態フラグ
-        self._stream: Optional[sd.InputStream] = None  # 音声入力ストリーム
+        self._stream: Optional["sd.InputStream"] = None  # 音声入力ストリーム
         self._level_callback: Optional[callable] = None  # 音声レベルコールバック
         self._level_threshold = 0.02  # 音声検出のしきい値
         self._input_device: Optional[Union[int, str]] = None
@@ -81,12 +122,20 @@ class AudioRecorder:
 
         return None
 
-    @staticmethod
-    def list_input_devices() -> List[Dict[str, Any]]:
+    @classmethod
+    def list_input_devices(cls) -> List[Dict[str, Any]]:
         """
         利用可能な入力デバイス一覧を取得する。
+
+        結果は invalidate_device_cache() が呼ばれるまでキャッシュされる
+        （設定画面の Refresh ボタンで破棄される）。
         """
+        with cls._device_cache_lock:
+            if cls._device_cache is not None:
+                return list(cls._device_cache)
+
         try:
+            sd = _get_sounddevice()
             devices = sd.query_devices()
             hostapis = sd.query_hostapis()
         except Exception as e:
@@ -113,7 +162,15 @@ class AudioRecorder:
                 "max_input_channels": max_input_channels,
             })
 
-        return results
+        with cls._device_cache_lock:
+            cls._device_cache = results
+        return list(results)
+
+    @classmethod
+    def invalidate_device_cache(cls) -> None:
+        """入力デバイス一覧のキャッシュを破棄する（次回取得時に再列挙する）。"""
+        with cls._device_cache_lock:
+            cls._device_cache = None
 
     def set_input_device(self, device: Any) -> None:
         """
@@ -148,40 +205,88 @@ class AudioRecorder:
         """録音中かどうかを返す。"""
         return self._recording
 
-    def _audio_callback(
-        self,
-        indata: np.ndarray,
-        frames: int,
-        time_info: Any,
-        status: sd.CallbackFlags
-    ) -> None:
+    def _build_audio_callback(self) -> Callable[..., None]:
         """
-        sounddeviceからのコールバック関数。
-        
-        音声データを受け取るたびに呼び出され、キューに追加する。
-        音声レベルを計算してコールバックに通知する。
-        
-        Args:
-            indata: 受信した音声データ
-            frames: フレーム数
-            time_info: タイミング情報
-            status: ステータスフラグ（エラー時に設定される）
+        録音1回分の sounddevice コールバックを生成する。
+
+        コールバックは数十〜数百Hzで呼ばれるため、毎回参照する関数・定数・
+        レベル通知先を録音開始時にクロージャのローカル変数へ束縛し、
+        グローバル/属性参照を避ける。レベル通知先の変更は次回録音から反映される。
+
+        Returns:
+            sd.InputStream に渡すコールバック関数
         """
-        if status:
-            logger.warning(f"音声コールバック ステータス: {status}")
-        
-        # データをコピーしてキューに追加（元データは再利用されるため）
-        self._queue.put(indata.copy())
-        
-        # 音声レベルを計算してコールバックに通知
-        if self._level_callback:
-            # RMSで音声レベルを計算
-            level = float(np.sqrt(np.mean(indata ** 2)))
-            # 正規化（0.0-1.0）- 最大値を0.3程度と仮定
-            normalized_level = min(1.0, level / 0.3)
-            # しきい値を超えたら音声ありと判定
-            has_voice = level > self._level_threshold
-            self._level_callback(normalized_level, has_voice)
+        warn = logger.warning
+        einsum = np.einsum
+        int64 = np.int64
+        sqrt = math.sqrt
+        monotonic = time.monotonic
+        level_cb = self._level_callback
+        threshold = self._level_threshold
+        emit_interval = self._LEVEL_EMIT_INTERVAL_SEC
+        int16_to_float = self._INT16_TO_FLOAT
+        level_scale = self._LEVEL_SCALE
+
+        # 音声レベル通知の間引き用（前回通知時刻と、それ以降の二乗和・サンプル数）
+        last_emit = 0.0
+        sumsq_accum = 0
+        samples_accum = 0
+
+        def _audio_callback(
+            indata: np.ndarray,
+            frames: int,
+            time_info: Any,
+            status: "sd.CallbackFlags"
+        ) -> None:
+            """
+            sounddeviceからのコールバック関数。
+
+            音声データを受け取るたびに呼び出され、録音バッファに追記する。
+            音声レベルを計算してコールバックに通知する。
+
+            Args:
+                indata: 受信した音声データ
+                frames: フレーム数
+                time_info: タイミング情報
+                status: ステータスフラグ（エラー時に設定される）
+            """
+            nonlocal last_emit, sumsq_accum, samples_accum
+
+            # ステータス文字列の整形はログ出力が実際に行われる場合だけに遅延させる
+            if status:
+                warn("音声コールバック ステータス: %s", status)
+
+            # 先頭チャンネルを録音バッファへ直接コピー（元データは再利用されるため）
+            start = self._write_idx
+            end = start + frames
+            if end > self._buffer.size:
+                self._grow_buffer(end)
+            self._buffer[start:end] = indata[:, 0]
+            self._write_idx = end
+
+            if level_cb is None:
+                return
+
+            # 音声レベルを計算してコールバックに通知
+            # indata ** 2 の一時配列を作らず、int64 累積の積和1パスで二乗和を求める
+            # （int16 同士の np.dot は桁あふれするため einsum で累積型を指定する）
+            flat = indata.reshape(-1)
+            sumsq_accum += int(einsum("i,i->", flat, flat, dtype=int64))
+            samples_accum += flat.size
+
+            # 通知は _LEVEL_EMIT_INTERVAL_SEC ごとに、その間の全サンプルの RMS で行う
+            now = monotonic()
+            if now - last_emit < emit_interval:
+                return
+            level = sqrt(sumsq_accum / samples_accum) * int16_to_float if samples_accum else 0.0
+            last_emit = now
+            sumsq_accum = 0
+            samples_accum = 0
+
+            # 正規化（0.0-1.0）と、しきい値による音声あり判定
+            level_cb(min(1.0, level * level_scale), level > threshold)
+
+        return _audio_callback
 
     def start(self) -> bool:
         """
@@ -200,14 +305,15 @@ class AudioRecorder:
                 self._cleanup_stream()
 
             try:
-                # キューをクリア
-                self._clear_queue()
+                # 録音バッファを巻き戻す
+                self._reset_buffer()
 
+                sd = _get_sounddevice()
                 stream_kwargs = {
                     "samplerate": self.sample_rate,
                     "channels": AUDIO_CHANNELS,
                     "dtype": AUDIO_DTYPE,
-                    "callback": self._audio_callback,
+                    "callback": self._build_audio_callback(),
                 }
                 if self._input_device is not None:
                     stream_kwargs["device"] = self._input_device
@@ -230,6 +336,11 @@ class AudioRecorder:
                 self._recording = True
                 device_label = "default" if self._input_device is None else str(self._input_device)
                 logger.info(f"録音開始... (input_device={device_label})")
+
+                # 録音中に MP3 エンコーダ（ffmpeg）を先行起動し、停止後の起動待ちを隠す
+                threading.Thread(
+                    target=prewarm_mp3_encoder, args=(self.sample_rate,), daemon=True
+                ).start()
                 return True
 
             except Exception as e:
@@ -257,10 +368,21 @@ class AudioRecorder:
 
             return self._collect_audio_data()
 
-    def _clear_queue(self) -> None:
-        """キューをクリアする。"""
-        with self._queue.mutex:
-            self._queue.queue.clear()
+    def _reset_buffer(self) -> None:
+        """録音バッファの書き込み位置を先頭に戻す（確保済み領域は再利用する）。"""
+        self._write_idx = 0
+
+    def _grow_buffer(self, min_size: int) -> None:
+        """
+        録音バッファを min_size 以上に拡張する（倍々で確保し、書き込み済み部分を引き継ぐ）。
+
+        Args:
+            min_size: 必要な最小サンプル数
+        """
+        new_size = max(min_size, self._buffer.size * 2)
+        new_buffer = np.empty(new_size, dtype=self._buffer.dtype)
+        new_buffer[:self._write_idx] = self._buffer[:self._write_idx]
+        self._buffer = new_buffer
 
     def _cleanup_stream(self) -> None:
         """音声ストリームをクリーンアップする。
@@ -287,28 +409,20 @@ class AudioRecorder:
 
     def _collect_audio_data(self) -> npt.NDArray[np.float32]:
         """
-        キューから全ての音声データを収集する。
+        録音バッファから書き込み済みの音声データを取り出す。
+
+        int16 で録音したデータを、ここで1回だけ float32 [-1.0, 1.0) に変換する。
         
         Returns:
-            結合された音声データ（1次元配列）
+            録音した音声データ（float32の1次元配列。バッファは次回録音で再利用するため新しい配列を返す）
         """
-        data_list: List[np.ndarray] = []
-        
-        # キューから全データを取得
-        while not self._queue.empty():
-            data_list.append(self._queue.get())
-            
-        if not data_list:
-            return np.array([], dtype=np.float32)
-            
-        try:
-            # 全データを結合して1次元配列に変換
-            audio_data = np.concatenate(data_list, axis=0)
-            return audio_data.flatten()
-        except Exception as e:
-            logger.error(f"音声データ処理エラー: {e}")
+        if self._write_idx == 0:
             return np.array([], dtype=np.float32)
 
+        return np.multiply(
+            self._buffer[:self._write_idx], self._INT16_TO_FLOAT, dtype=np.float32
+        )
+
     # 後方互換性のためのエイリアス
     def start_recording(self) -> bool:
         """start()のエイリアス。"""
@@ -6,12 +6,12 @@ Groq/OpenAI APIなどへの送信時に使用される。
 MP3形式はWAVより約10倍小さく、転送時間を大幅に短縮できる。
 """
 
+import atexit
 import io
 import struct
 import subprocess
-import tempfile
-import os
-from typing import Literal
+import threading
+from typing import Any, Literal, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -28,6 +28,158 @@ try:
 except (subprocess.SubprocessError, FileNotFoundError, OSError):
     _ffmpeg_available = False
 
+# 録音開始時に先行起動した ffmpeg: ((サンプリングレート, ビットレート), プロセス)
+_prewarmed_encoder: Optional[Tuple[Tuple[int, str], subprocess.Popen]] = None
+_prewarm_lock = threading.Lock()
+
+# int16 PCM の値域（float32 -> int16 のスケーリングと飽和に使用）
+_INT16_MAX = float(np.iinfo(np.int16).max)
+_INT16_MIN = float(np.iinfo(np.int16).min)
+
+# WAV の PCM は常にリトルエンディアン
+_PCM16_DTYPE = np.dtype("<i2")
+
+# float32 -> int16 変換用のスクラッチ（呼び出し間で再利用し、必要時のみ拡張）
+_int16_scratch: npt.NDArray[np.float32] = np.empty(0, dtype=np.float32)
+# スクラッチとして保持する最大サンプル数（16kHz で60秒、約3.8MB）。
+# これを超える長い録音は呼び出し毎に確保し、プロセス終了まで大きな領域を抱えない
+_INT16_SCRATCH_MAX_SAMPLES: int = 16000 * 60
+_int16_scratch_lock = threading.Lock()
+
+# 44バイトの PCM WAV ヘッダー（RIFF + fmt + data チャンク見出し）
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _float_to_int16(
+    audio_data: npt.NDArray[np.float32],
+    out: Optional[npt.NDArray[np.int16]] = None
+) -> npt.NDArray[np.int16]:
+    """
+    float32 音声を int16 PCM に変換する（四捨五入し、範囲外はラップせず飽和させる）。
+
+    スケーリング・丸め・clip はモジュール共有の float32 スクラッチ上でその場に行い、
+    呼び出し毎の一時配列確保を避ける（_INT16_SCRATCH_MAX_SAMPLES を超える音声は
+    一時配列を使う）。出力はリトルエンディアン int16（'<i2'）。
+
+    Args:
+        audio_data: float32形式の音声データ（-1.0〜1.0の範囲）
+        out: 書き込み先の int16 配列（省略時は新規確保）
+
+    Returns:
+        int16形式の音声データ（out 指定時は out）
+    """
+    global _int16_scratch
+    num_samples = len(audio_data)
+    if out is None:
+        out = np.empty(num_samples, dtype=_PCM16_DTYPE)
+
+    if num_samples > _INT16_SCRATCH_MAX_SAMPLES:
+        _scale_to_int16(audio_data, np.empty(num_samples, dtype=np.float32), out)
+        return out
+
+    with _int16_scratch_lock:
+        if _int16_scratch.size < num_samples:
+            _int16_scratch = np.empty(num_samples, dtype=np.float32)
+        _scale_to_int16(audio_data, _int16_scratch[:num_samples], out)
+    return out
+
+
+def _scale_to_int16(
+    audio_data: npt.NDArray[np.float32],
+    scaled: npt.NDArray[np.float32],
+    out: npt.NDArray[np.int16]
+) -> None:
+    """scaled を作業領域として、float32 音声を四捨五入・飽和させた int16 を out に書き込む。"""
+    np.multiply(audio_data, _INT16_MAX, out=scaled)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, _INT16_MIN, _INT16_MAX, out=scaled)
+    np.copyto(out, scaled, casting="unsafe")
+
+
+def _spawn_mp3_encoder(sample_rate: int, bitrate: str) -> subprocess.Popen:
+    """s16le PCM を標準入力から受け取り MP3 を標準出力へ書き出す ffmpeg を起動する。"""
+    return subprocess.Popen(
+        [
+            "ffmpeg", "-loglevel", "error",
+            "-f", "s16le",
+            "-ar", str(sample_rate),
+            "-ac", "1",
+            "-i", "pipe:0",
+            "-b:a", bitrate,
+            "-f", "mp3",
+            "pipe:1"
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+
+
+def _discard_encoder(proc: subprocess.Popen) -> None:
+    """未使用の ffmpeg プロセスを終了させる。"""
+    try:
+        proc.kill()
+        proc.communicate()
+    except (OSError, ValueError):
+        pass
+
+
+def prewarm_mp3_encoder(sample_rate: int = 16000, bitrate: str = "64k") -> None:
+    """
+    次回の MP3 変換用に ffmpeg プロセスを先行起動しておく。
+
+    録音開始時に呼び出すことで、録音停止後の変換で fork/exec の待ち時間が
+    発生しないようにする。ffmpeg が利用できない場合は何もしない。
+
+    Args:
+        sample_rate: サンプリングレート（Hz）
+        bitrate: MP3ビットレート
+    """
+    global _prewarmed_encoder
+    if not _ffmpeg_available:
+        return
+
+    try:
+        proc = _spawn_mp3_encoder(sample_rate, bitrate)
+    except OSError:
+        return
+
+    with _prewarm_lock:
+        stale = _prewarmed_encoder
+        _prewarmed_encoder = ((sample_rate, bitrate), proc)
+
+    # 使われなかった前回分（VADで無音判定された場合など）は破棄
+    if stale is not None:
+        _discard_encoder(stale[1])
+
+
+def _take_prewarmed_encoder(sample_rate: int, bitrate: str) -> Optional[subprocess.Popen]:
+    """条件が一致する先行起動済み ffmpeg を取り出す。無ければ None。"""
+    global _prewarmed_encoder
+    with _prewarm_lock:
+        entry = _prewarmed_encoder
+        _prewarmed_encoder = None
+
+    if entry is None:
+        return None
+
+    key, proc = entry
+    if key != (sample_rate, bitrate) or proc.poll() is not None:
+        _discard_encoder(proc)
+        return None
+    return proc
+
+
+@atexit.register
+def _shutdown_prewarmed_encoder() -> None:
+    """終了時に未使用の ffmpeg プロセスを残さない。"""
+    global _prewarmed_encoder
+    with _prewarm_lock:
+        entry = _prewarmed_encoder
+        _prewarmed_encoder = None
+    if entry is not None:
+        _discard_encoder(entry[1])
+
 
 def numpy_to_mp3_bytes(
     audio_data: npt.NDArray[np.float32],
@@ -57,46 +209,64 @@ def numpy_to_mp3_bytes(
             "WAV形式を使用するか、ffmpegをインストールしてください。"
         )
     
-    # float32 [-1.0, 1.0] から int16 [-32768, 32767] に変換
-    audio_int16 = (audio_data * 32767).astype(np.int16)
-    
-    # 一時ファイルを使用してffmpegで変換
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-        wav_path = wav_file.name
-        # WAVヘッダーを書き込み
-        wav_bytes = numpy_to_wav_bytes(audio_data, sample_rate)
-        wav_file.write(wav_bytes)
-    
-    mp3_path = wav_path.replace(".wav", ".mp3")
-    
+    audio_int16 = _float_to_int16(audio_data)
+
+    # 生PCMを標準入力へ流し、MP3を標準出力から受け取る（一時ファイル不要）
+    proc = _take_prewarmed_encoder(sample_rate, bitrate) or _spawn_mp3_encoder(sample_rate, bitrate)
     try:
-        # ffmpegでMP3に変換
-        result = subprocess.run(
-            [
-                "ffmpeg", "-y",
-                "-i", wav_path,
-                "-ar", str(sample_rate),
-                "-ac", "1",
-                "-b:a", bitrate,
-                "-f", "mp3",
-                mp3_path
-            ],
-            capture_output=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg変換エラー: {result.stderr.decode()}")
-        
-        with open(mp3_path, "rb") as f:
-            return f.read()
-    
-    finally:
-        # 一時ファイルをクリーンアップ
-        if os.path.exists(wav_path):
-            os.remove(wav_path)
-        if os.path.exists(mp3_path):
-            os.remove(mp3_path)
+        mp3_bytes, stderr = proc.communicate(audio_int16.tobytes(), timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise RuntimeError("ffmpeg変換がタイムアウトしました")
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg変換エラー: {stderr.decode(errors='replace')}")
+
+    return mp3_bytes
+
+
+def _write_wav(
+    buffer: Any,
+    audio_data: npt.NDArray[np.float32],
+    sample_rate: int,
+    channels: int,
+    bits_per_sample: int
+) -> None:
+    """
+    書き込み可能なバッファ（44 + データサイズ バイト）へ WAV をその場で書き込む。
+
+    Args:
+        buffer: 書き込み先（bytearray / memoryview 等）
+        audio_data: float32形式の音声データ（-1.0〜1.0の範囲）
+        sample_rate: サンプリングレート（Hz）
+        channels: チャンネル数
+        bits_per_sample: ビット深度
+    """
+    num_samples = len(audio_data)
+    bytes_per_sample = bits_per_sample // 8
+    data_size = num_samples * channels * bytes_per_sample
+
+    # WAVヘッダー（RIFF / fmt / data チャンク見出し）を一括で構築
+    _WAV_HEADER.pack_into(
+        buffer, 0,
+        b'RIFF', 36 + data_size, b'WAVE',                 # ファイル識別子, ファイルサイズ - 8
+        b'fmt ', 16, 1, channels, sample_rate,            # fmtチャンクサイズ, PCMフォーマット
+        sample_rate * channels * bytes_per_sample,        # バイトレート
+        channels * bytes_per_sample, bits_per_sample,     # ブロックサイズ, ビット深度
+        b'data', data_size
+    )
+
+    # float32 [-1.0, 1.0] から int16 [-32768, 32767] に変換し、data 部へ直接書き込む
+    _float_to_int16(
+        audio_data,
+        out=np.frombuffer(buffer, dtype=_PCM16_DTYPE, count=num_samples, offset=_WAV_HEADER.size)
+    )
+
+
+def _wav_size(num_samples: int, channels: int, bits_per_sample: int) -> int:
+    """WAV ファイル全体（ヘッダー + データ）のバイト数を返す。"""
+    return _WAV_HEADER.size + num_samples * channels * (bits_per_sample // 8)
 
 
 def numpy_to_wav_bytes(
@@ -117,36 +287,43 @@ def numpy_to_wav_bytes(
     Returns:
         WAVファイル形式のバイト列
     """
-    # float32 [-1.0, 1.0] から int16 [-32768, 32767] に変換
-    audio_int16 = (audio_data * 32767).astype(np.int16)
+    # 出力全体を1回で確保し、ヘッダーと PCM をその場に書き込む
+    wav = bytearray(_wav_size(len(audio_data), channels, bits_per_sample))
+    _write_wav(wav, audio_data, sample_rate, channels, bits_per_sample)
+    return bytes(wav)
 
-    # WAVヘッダーを構築
-    buffer = io.BytesIO()
 
-    # データサイズを計算
-    data_size = len(audio_int16) * channels * (bits_per_sample // 8)
+def numpy_to_wav_file(
+    audio_data: npt.NDArray[np.float32],
+    sample_rate: int = 16000,
+    channels: int = 1,
+    bits_per_sample: int = 16
+) -> io.BytesIO:
+    """
+    NumPy音声配列を WAV 形式のファイルオブジェクト（BytesIO）に変換する。
 
-    # RIFFヘッダー（ファイル識別子）
-    buffer.write(b'RIFF')
-    buffer.write(struct.pack('<I', 36 + data_size))  # ファイルサイズ - 8
-    buffer.write(b'WAVE')
+    BytesIO の内部バッファへ直接書き込むため、numpy_to_wav_bytes() +
+    io.BytesIO() の組み合わせで発生するペイロード全体のコピーが無い。
 
-    # fmtチャンク（フォーマット情報）
-    buffer.write(b'fmt ')
-    buffer.write(struct.pack('<I', 16))              # fmtチャンクサイズ
-    buffer.write(struct.pack('<H', 1))               # PCMフォーマット
-    buffer.write(struct.pack('<H', channels))        # チャンネル数
-    buffer.write(struct.pack('<I', sample_rate))     # サンプリングレート
-    buffer.write(struct.pack('<I', sample_rate * channels * (bits_per_sample // 8)))  # バイトレート
-    buffer.write(struct.pack('<H', channels * (bits_per_sample // 8)))  # ブロックサイズ
-    buffer.write(struct.pack('<H', bits_per_sample)) # ビット深度
+    Args:
+        audio_data: float32形式の音声データ（-1.0〜1.0の範囲）
+        sample_rate: サンプリングレート（Hz）
+        channels: チャンネル数（1=モノラル、2=ステレオ）
+        bits_per_sample: ビット深度（16または32）
+
+    Returns:
+        先頭にシーク済みの WAV ファイルオブジェクト
+    """
+    # 末尾の1バイトを書き込み、内部バッファを必要サイズちょうど（ゼロ埋め）で確保する
+    wav_file = io.BytesIO()
+    wav_file.seek(_wav_size(len(audio_data), channels, bits_per_sample) - 1)
+    wav_file.write(b"\0")
 
-    # dataチャンク（音声データ本体）
-    buffer.write(b'data')
-    buffer.write(struct.pack('<I', data_size))
-    buffer.write(audio_int16.tobytes())
+    with wav_file.getbuffer() as view:
+        _write_wav(view, audio_data, sample_rate, channels, bits_per_sample)
 
-    return buffer.getvalue()
+    wav_file.seek(0)
+    return wav_file
 
 
 def numpy_to_audio_bytes(
@@ -172,3 +349,31 @@ def numpy_to_audio_bytes(
         return numpy_to_wav_bytes(audio_data, sample_rate), "wav"
 
 
+def numpy_to_audio_file(
+    audio_data: npt.NDArray[np.float32],
+    sample_rate: int = 16000,
+    format: Literal["mp3", "wav"] = "mp3"
+) -> io.BytesIO:
+    """
+    NumPy音声データを API アップロード用のファイルオブジェクトに変換する。
+
+    numpy_to_audio_bytes() と同じ形式選択を行い、`name` 属性
+    （"audio.mp3" / "audio.wav"）を設定した BytesIO を返す。
+
+    Args:
+        audio_data: float32形式の音声データ
+        sample_rate: サンプリングレート（Hz）
+        format: 出力形式 ("mp3" または "wav")
+
+    Returns:
+        先頭にシーク済みの音声ファイルオブジェクト
+    """
+    if format == "mp3" and _ffmpeg_available:
+        # bytes を初期値とする BytesIO は内部でコピーせず共有する
+        audio_file = io.BytesIO(numpy_to_mp3_bytes(audio_data, sample_rate))
+        audio_file.name = "audio.mp3"
+    else:
+        # MP3が利用できない場合はWAVにフォールバック
+        audio_file = numpy_to_wav_file(audio_data, sample_rate)
+        audio_file.name = "audio.wav"
+    return audio_file
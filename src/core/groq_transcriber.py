@@ -5,8 +5,10 @@ Groq CloudのWhisper APIを使用して高速な文字起こしを行う。
 ローカルGPU不要で、リアルタイムの最大300倍の速度を実現。
 """
 
-import io
+import logging
 import os
+import threading
+import time
 from typing import Optional
 
 import httpx
@@ -14,7 +16,8 @@ import httpx
 import numpy as np
 import numpy.typing as npt
 
-from .audio_utils import numpy_to_audio_bytes
+from .audio_utils import numpy_to_audio_file
+from .http_client import get_shared_http_client
 from ..config.constants import SAMPLE_RATE
 from ..utils import secrets
 from ..utils.logger import get_logger
@@ -83,6 +86,9 @@ class GroqTranscriber:
         self.temperature = temperature
         self.sample_rate = sample_rate
         self._client: Optional[Groq] = None  # Groqクライアント（遅延初期化）
+        self._http_client: Optional[httpx.Client] = None  # 共有HTTPクライアント（接続の事前確立用）
+        # 録音開始時の load_model スレッドと文字起こしワーカーの同時初期化を防ぐ
+        self._client_lock = threading.Lock()
         
         # VAD設定
         self.vad_enabled = vad_filter
@@ -94,6 +100,10 @@ class GroqTranscriber:
                 use_cuda=True  # 利用可能なハードウェアアクセラレーションを使用
             )
 
+        # タイミング情報
+        self.last_vad_time = 0
+        self.last_api_time = 0
+
         # モデル名の検証
         if model not in self.AVAILABLE_MODELS:
             logger.warning(
@@ -132,20 +142,34 @@ class GroqTranscriber:
         Raises:
             RuntimeError: APIキーが設定されていない場合
         """
-        if self._client is None:
-            api_key = self._resolve_api_key()
-            if not api_key:
-                raise RuntimeError(
-                    "Groq の API キーが設定されていません。 "
-                    "設定ウィンドウから保存するか、GROQ_API_KEY 環境変数を設定してください"
-                )
-            # HTTPコネクションプーリングで高速化 + 20秒タイムアウト
-            http_client = httpx.Client(
-                timeout=httpx.Timeout(20.0, connect=5.0),
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-            )
-            self._client = Groq(api_key=api_key, http_client=http_client)
-        return self._client
+        with self._client_lock:
+            if self._client is None:
+                api_key = self._resolve_api_key()
+                if not api_key:
+                    raise RuntimeError(
+                        "Groq の API キーが設定されていません。 "
+                        "設定ウィンドウから保存するか、GROQ_API_KEY 環境変数を設定してください"
+                    )
+                # プロセス共有の HTTP クライアントで TCP + TLS 接続を Transcriber 間で再利用
+                http_client = get_shared_http_client()
+                self._client = Groq(api_key=api_key, http_client=http_client)
+                self._http_client = http_client
+            return self._client
+
+    def _warm_connection(self, client: Groq) -> None:
+        """
+        APIホストへの接続（TCP + TLS）を事前に確立し、コネクションプールに保持させる。
+
+        録音中に済ませておくことで、文字起こし時のリクエストがハンドシェイクを待たずに済む。
+        失敗しても本番リクエスト側で通常どおり接続するため、例外は無視する。
+        """
+        http_client = self._http_client
+        if http_client is None:
+            return
+        try:
+            http_client.head(str(client.base_url), timeout=5.0)
+        except Exception as e:
+            logger.debug(f"Groq接続の事前確立に失敗（無視）: {e}")
 
     def transcribe(self, audio_data: npt.NDArray[np.float32]) -> str:
         """
@@ -164,13 +188,13 @@ class GroqTranscriber:
         if len(audio_data) == 0:
             return ""
 
-        import time
-        
-        # VADフィルター：発話がない場合はAPI呼び出しをスキップ
+        # VADフィルター：前後の無音をトリムし、発話がない場合はAPI呼び出しをスキップ
+        # （送信サイズとAPI側のデコード対象が無音分だけ減る）
         if self.vad_enabled and self._vad_filter:
             vad_start = time.perf_counter()
-            has_speech = self._vad_filter.has_speech(audio_data, self.sample_rate)
+            audio_data = self._vad_filter.trim(audio_data, self.sample_rate)
             self.last_vad_time = (time.perf_counter() - vad_start) * 1000
+            has_speech = len(audio_data) > 0
             logger.info(f"VADチェック: has_speech={has_speech}, vad_time={self.last_vad_time:.0f}ms")
             if not has_speech:
                 logger.debug("VAD: 発話が検出されなかったため、Groq API呼び出しをスキップします。")
@@ -183,9 +207,7 @@ class GroqTranscriber:
 
         try:
             # NumPy配列をMP3に変換（WAVより約10倍小さい）、ffmpegがなければWAVにフォールバック
-            audio_bytes, audio_ext = numpy_to_audio_bytes(audio_data, self.sample_rate, format="mp3")
-            audio_file = io.BytesIO(audio_bytes)
-            audio_file.name = f"audio.{audio_ext}"
+            audio_file = numpy_to_audio_file(audio_data, self.sample_rate, format="mp3")
 
             # Groq API呼び出し（API時間を計測）
             api_start = time.perf_counter()
@@ -200,19 +222,13 @@ class GroqTranscriber:
             )
             self.last_api_time = (time.perf_counter() - api_start) * 1000
 
-            # テキスト抽出（レスポンス形式に応じて処理）
-            if isinstance(transcription, str):
-                text = transcription
-            elif hasattr(transcription, 'text'):
-                text = transcription.text
-            else:
-                # 予期しない型への対応
-                text = str(transcription)
-            
+            # response_format="text" では SDK は str を返す（型付きレスポンスの場合のみ .text を参照）
+            text = transcription if isinstance(transcription, str) else transcription.text
             # 前後のスペース・改行を確実に除去
             text = text.strip()
             
-            logger.debug(f"Groq文字起こし: {text[:100]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Groq文字起こし: {text[:100]}...")
             return text
 
         except Exception as e:
@@ -224,37 +240,36 @@ class GroqTranscriber:
         Groqクライアントを事前初期化する（オプション）。
         
         Groq APIはサーバーレスのため、実際のモデルロードは不要。
+        録音開始時に別スレッドから呼ばれるため、ここで API ホストへの接続も
+        確立しておき、TLS ハンドシェイクを録音と並行して済ませる。
         """
         if self.is_available():
             try:
-                self._get_client()
+                client = self._get_client()
+                self._warm_connection(client)
                 logger.debug("Groqクライアントを初期化しました")
             except Exception as e:
                 logger.warning(f"Groqクライアントの初期化に失敗: {e}")
 
     def unload_model(self) -> None:
         """
-        クライアント参照をクリアする。
+        モデルをアンロードする（Groqでは何もしない）。
 
-        Groq APIはサーバーレスのため、キャッシュされたクライアントをクリアするのみ。
-        HTTP コネクションプールも close() して接続リークを防ぐ。
+        Groq APIはサーバーレスのため解放すべきモデルは無い。
+        クライアントと HTTP コネクションプールは次回の文字起こしで
+        TLS ハンドシェイクを省けるよう保持し、破棄は close() で行う。
         """
-        self.close()
+        logger.debug("Groqクライアントは接続を保持したまま維持します")
 
     def close(self) -> None:
-        """Groq クライアントの HTTP コネクションプールを閉じる。
+        """Groq クライアント参照を破棄する。
 
-        ホットリロード等で本インスタンスが破棄される際に呼び、
-        httpx 接続プールが leak しないようにする。
+        ホットリロード等で本インスタンスが破棄される際に呼ぶ。
+        HTTP コネクションプールはプロセス共有のため閉じない
+        （SDK の close() は共有 httpx クライアントまで閉じてしまう）。
         """
-        client = self._client
-        if client is not None:
-            try:
-                if hasattr(client, "close"):
-                    client.close()
-            except Exception as e:
-                logger.warning(f"Groqクライアント close に失敗: {e}")
         self._client = None
+        self._http_client = None
         logger.debug("Groqクライアント参照をクリアしました")
 
     def preload_vad(self) -> None:
@@ -0,0 +1,58 @@
+"""
+API共有HTTPクライアントモジュール
+
+Groq / OpenAI の SDK クライアントが共用する httpx.Client を提供する。
+スロット毎・ホットリロード毎に生成される Transcriber 間で
+TCP + TLS 接続（コネクションプール）を使い回し、ハンドシェイクを省く。
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# HTTP/2（httpx[http2] の h2）の利用可否。未インストール時は HTTP/1.1 で接続する
+_http2_available: bool = False
+try:
+    import h2  # noqa: F401
+    _http2_available = True
+except ImportError:
+    logger.debug("h2 が無いため API には HTTP/1.1 で接続します（pip install httpx[http2]）")
+
+# プロセス全体で共有する httpx クライアント（遅延生成）
+_shared_client: Optional[httpx.Client] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """
+    API呼び出し用の共有 httpx クライアントを取得する（初回呼び出し時に生成）。
+
+    httpx のコネクションプールはホスト毎に接続を保持するため、
+    Groq / OpenAI の両方で1つのクライアントを共有できる。
+    SDK クライアントの close() はこのクライアントも閉じてしまうため、
+    利用側は close() を呼ばず参照を破棄するだけにすること。
+
+    Returns:
+        共有 httpx.Client
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            # HTTPコネクションプーリングで高速化 + 20秒タイムアウト
+            # HTTP/2 が使える場合は1本の TLS 接続上でリクエストを多重化する
+            # keepalive_expiry: httpx 既定の5秒では発話間隔で接続が切れ、毎回 TLS を張り直すため延長
+            _shared_client = httpx.Client(
+                http2=_http2_available,
+                timeout=httpx.Timeout(20.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=10,
+                    max_keepalive_connections=5,
+                    keepalive_expiry=60.0
+                )
+            )
+        return _shared_client
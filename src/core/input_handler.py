@@ -6,6 +6,7 @@
 日本語などのマルチバイト文字にも対応。
 """
 
+import logging
 import time
 from typing import Optional
 
@@ -18,8 +19,16 @@ from ..platform import PlatformAdapter, get_platform_adapter
 logger = get_logger(__name__)
 
 # クリップボード貼り付け前の待機時間（秒）
+# 変更カウンタを取得できる OS ではポーリング待機の上限として使う
 PASTE_DELAY: float = 0.1
 
+# クリップボード書き込み反映のポーリング間隔（秒）
+CLIPBOARD_POLL_INTERVAL: float = 0.001
+
+# クリップボードを経由せず直接キー入力する ASCII テキストの最大長（文字）
+# これより長い場合は1文字ずつの入力より貼り付けの方が速い
+DIRECT_TYPE_MAX_LENGTH: int = 200
+
 
 class InputHandler:
     """
@@ -34,7 +43,7 @@ class InputHandler:
         self._keyboard = Controller()
         self._platform = platform_adapter or get_platform_adapter()
 
-    def insert_text(self, text: str) -> bool:
+    def insert_text(self, text: str, type_ascii_directly: bool = False) -> bool:
         """
         アクティブウィンドウにテキストを挿入する。
         
@@ -43,6 +52,8 @@ class InputHandler:
         
         Args:
             text: 挿入するテキスト
+            type_ascii_directly: Trueの場合、ASCIIのみの短いテキストは
+                クリップボードを経由せずキー入力する
             
         Returns:
             成功した場合True、失敗した場合False
@@ -50,34 +61,71 @@ class InputHandler:
         if not text:
             return False
 
+        # ASCII のみの短いテキストはクリップボードを上書きせず直接入力する
+        # （失敗時は文字起こし結果を失わないようクリップボード貼り付けにフォールバック）
+        if type_ascii_directly and len(text) <= DIRECT_TYPE_MAX_LENGTH and text.isascii():
+            if self.type_text(text):
+                return True
+            logger.warning("直接入力に失敗したため、クリップボード経由で貼り付けます")
+
         try:
             # クリップボードにコピー
+            change_count = self._platform.clipboard_change_count()
             pyperclip.copy(text)
             
-            # クリップボードの準備が整うまで少し待機
-            time.sleep(PASTE_DELAY)
+            # クリップボードへの書き込みが反映されるまで待機
+            self._wait_for_clipboard(change_count)
             
-            # OS別アダプタが定義する貼り付けショートカットを使用
-            # 修飾キーが押しっぱなしになる事故を防ぐため try/finally で確実に release
-            paste_modifier = self._platform.paste_modifier
-            self._keyboard.press(paste_modifier)
-            try:
-                self._keyboard.press('v')
-                self._keyboard.release('v')
-            finally:
-                try:
-                    self._keyboard.release(paste_modifier)
-                except Exception as e:
-                    # release 失敗は致命ではないが、修飾キーが残ると操作不能になるため警告
-                    logger.warning(f"貼り付け修飾キーの解放に失敗: {e}")
-
-            logger.debug(f"テキスト挿入: {text[:50]}...")
+            # OS ネイティブ API で貼り付けショートカットを一括送信（Windows: SendInput）
+            # 未対応の場合は pynput で1キーずつ送信する
+            if not self._platform.send_paste_shortcut():
+                self._send_paste_with_pynput()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"テキスト挿入: {text[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"テキスト挿入エラー: {e}")
             return False
 
+    def _send_paste_with_pynput(self) -> None:
+        """OS別アダプタが定義する貼り付けショートカットを pynput で送信する。"""
+        # 修飾キーが押しっぱなしになる事故を防ぐため try/finally で確実に release
+        paste_modifier = self._platform.paste_modifier
+        self._keyboard.press(paste_modifier)
+        try:
+            self._keyboard.press('v')
+            self._keyboard.release('v')
+        finally:
+            try:
+                self._keyboard.release(paste_modifier)
+            except Exception as e:
+                # release 失敗は致命ではないが、修飾キーが残ると操作不能になるため警告
+                logger.warning(f"貼り付け修飾キーの解放に失敗: {e}")
+
+    def _wait_for_clipboard(self, previous_count: Optional[int]) -> None:
+        """
+        クリップボードへの書き込み反映を待つ。
+
+        OS の変更カウンタが取得できる場合は、値が変わるまでポーリングする
+        （通常は即座に変わるため待ち時間はほぼゼロ、上限は PASTE_DELAY）。
+        取得できない場合は従来どおり PASTE_DELAY だけ待機する。
+
+        Args:
+            previous_count: 書き込み前の変更カウンタ（取得できない場合は None）
+        """
+        if previous_count is None:
+            time.sleep(PASTE_DELAY)
+            return
+
+        deadline = time.monotonic() + PASTE_DELAY
+        while self._platform.clipboard_change_count() == previous_count:
+            if time.monotonic() >= deadline:
+                logger.debug("クリップボード更新の確認がタイムアウトしました")
+                return
+            time.sleep(CLIPBOARD_POLL_INTERVAL)
+
     def press_enter(self) -> bool:
         """
         Enterキーを1回押す。
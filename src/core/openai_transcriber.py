@@ -5,17 +5,17 @@ OpenAI Audio Transcriptions APIを使用して高精度な文字起こしを行
 gpt-4o-transcribe / gpt-4o-mini-transcribe モデルをサポート。
 """
 
-import io
+import logging
 import os
+import threading
 import time
 from typing import Optional
 
-import httpx
-
 import numpy as np
 import numpy.typing as npt
 
-from .audio_utils import numpy_to_audio_bytes
+from .audio_utils import numpy_to_audio_file
+from .http_client import get_shared_http_client
 from ..config.constants import SAMPLE_RATE
 from ..utils import secrets
 from ..utils.logger import get_logger
@@ -83,6 +83,8 @@ class OpenAITranscriber:
         self.temperature = temperature
         self.sample_rate = sample_rate
         self._client: Optional[OpenAI] = None  # OpenAIクライアント（遅延初期化）
+        # 録音開始時の load_model スレッドと文字起こしワーカーの同時初期化を防ぐ
+        self._client_lock = threading.Lock()
 
         # VAD設定
         self.vad_enabled = vad_filter
@@ -136,20 +138,17 @@ class OpenAITranscriber:
         Raises:
             RuntimeError: APIキーが設定されていない場合
         """
-        if self._client is None:
-            api_key = self._resolve_api_key()
-            if not api_key:
-                raise RuntimeError(
-                    "OpenAI の API キーが設定されていません。 "
-                    "設定ウィンドウから保存するか、OPENAI_API_KEY 環境変数を設定してください"
-                )
-            # HTTPコネクションプーリングで高速化 + 20秒タイムアウト
-            http_client = httpx.Client(
-                timeout=httpx.Timeout(20.0, connect=5.0),
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-            )
-            self._client = OpenAI(api_key=api_key, http_client=http_client)
-        return self._client
+        with self._client_lock:
+            if self._client is None:
+                api_key = self._resolve_api_key()
+                if not api_key:
+                    raise RuntimeError(
+                        "OpenAI の API キーが設定されていません。 "
+                        "設定ウィンドウから保存するか、OPENAI_API_KEY 環境変数を設定してください"
+                    )
+                # プロセス共有の HTTP クライアントで TCP + TLS 接続を Transcriber 間で再利用
+                self._client = OpenAI(api_key=api_key, http_client=get_shared_http_client())
+            return self._client
 
     def transcribe(self, audio_data: npt.NDArray[np.float32]) -> str:
         """
@@ -168,11 +167,13 @@ class OpenAITranscriber:
         if len(audio_data) == 0:
             return ""
 
-        # VADフィルター：発話がない場合はAPI呼び出しをスキップ
+        # VADフィルター：前後の無音をトリムし、発話がない場合はAPI呼び出しをスキップ
+        # （送信サイズとAPI側のデコード対象が無音分だけ減る）
         if self.vad_enabled and self._vad_filter:
             vad_start = time.perf_counter()
-            has_speech = self._vad_filter.has_speech(audio_data, self.sample_rate)
+            audio_data = self._vad_filter.trim(audio_data, self.sample_rate)
             self.last_vad_time = (time.perf_counter() - vad_start) * 1000
+            has_speech = len(audio_data) > 0
             logger.info(f"VADチェック: has_speech={has_speech}, vad_time={self.last_vad_time:.0f}ms")
             if not has_speech:
                 logger.debug("VAD: 発話が検出されなかったため、OpenAI API呼び出しをスキップします。")
@@ -185,9 +186,7 @@ class OpenAITranscriber:
 
         try:
             # NumPy配列をMP3に変換（WAVより約10倍小さい）、ffmpegがなければWAVにフォールバック
-            audio_bytes, audio_ext = numpy_to_audio_bytes(audio_data, self.sample_rate, format="mp3")
-            audio_file = io.BytesIO(audio_bytes)
-            audio_file.name = f"audio.{audio_ext}"
+            audio_file = numpy_to_audio_file(audio_data, self.sample_rate, format="mp3")
 
             # OpenAI API呼び出し（API時間を計測）
             api_start = time.perf_counter()
@@ -202,19 +201,13 @@ class OpenAITranscriber:
             )
             self.last_api_time = (time.perf_counter() - api_start) * 1000
 
-            # テキスト抽出（レスポンス形式に応じて処理）
-            if isinstance(transcription, str):
-                text = transcription
-            elif hasattr(transcription, 'text'):
-                text = transcription.text
-            else:
-                # 予期しない型への対応
-                text = str(transcription)
-
+            # response_format="text" では SDK は str を返す（型付きレスポンスの場合のみ .text を参照）
+            text = transcription if isinstance(transcription, str) else transcription.text
             # 前後のスペース・改行を確実に除去
             text = text.strip()
 
-            logger.debug(f"OpenAI文字起こし: {text[:100]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"OpenAI文字起こし: {text[:100]}...")
             return text
 
         except Exception as e:
@@ -236,26 +229,21 @@ class OpenAITranscriber:
 
     def unload_model(self) -> None:
         """
-        クライアント参照をクリアする。
+        モデルをアンロードする（OpenAIでは何もしない）。
 
-        OpenAI APIはサーバーレスのため、キャッシュされたクライアントをクリアするのみ。
-        HTTP コネクションプールも close() して接続リークを防ぐ。
+        OpenAI APIはサーバーレスのため解放すべきモデルは無い。
+        クライアントと HTTP コネクションプールは次回の文字起こしで
+        TLS ハンドシェイクを省けるよう保持し、破棄は close() で行う。
         """
-        self.close()
+        logger.debug("OpenAIクライアントは接続を保持したまま維持します")
 
     def close(self) -> None:
-        """OpenAI クライアントの HTTP コネクションプールを閉じる。
+        """OpenAI クライアント参照を破棄する。
 
-        ホットリロード等で本インスタンスが破棄される際に呼び、
-        httpx 接続プールが leak しないようにする。
+        ホットリロード等で本インスタンスが破棄される際に呼ぶ。
+        HTTP コネクションプールはプロセス共有のため閉じない
+        （SDK の close() は共有 httpx クライアントまで閉じてしまう）。
         """
-        client = self._client
-        if client is not None:
-            try:
-                if hasattr(client, "close"):
-                    client.close()
-            except Exception as e:
-                logger.warning(f"OpenAIクライアント close に失敗: {e}")
         self._client = None
         logger.debug("OpenAIクライアント参照をクリアしました")
 
@@ -1 +0,0 @@
-# removed
@@ -7,8 +7,10 @@ Groq/OpenAIモードでの無音判定に使用される。
 """
 
 import platform
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-import torch
 import numpy as np
 import numpy.typing as npt
 
@@ -16,6 +18,38 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# トリム時に発話区間の前後へ残す余白（ミリ秒）。語頭・語尾の欠けを防ぐ
+TRIM_PADDING_MS: int = 200
+
+# エネルギーゲートのフレーム長（ミリ秒）
+ENERGY_GATE_FRAME_MS: int = 30
+
+# エネルギーゲートの無音しきい値（dBFS）。最も大きいフレームの RMS がこれ未満なら
+# 明らかな無音（ミュート・デジタル無音）として Silero を省略する。
+# 発話とノイズの区別は Silero に任せ、曖昧な音声はゲートで落とさない
+ENERGY_GATE_SILENCE_DBFS: float = -60.0
+
+# ENERGY_GATE_SILENCE_DBFS をフレームの平均二乗値に換算したもの
+_ENERGY_GATE_SILENCE_MEAN_SQUARE: float = (10.0 ** (ENERGY_GATE_SILENCE_DBFS / 20.0)) ** 2
+
+# ロード済み Silero VAD モデルのプロセス全体キャッシュ
+# キー: 要求デバイス、値: (モデル, 実際に使用するデバイス)
+# 推論は文字起こしワーカー1本で直列に行われるため、インスタンス間で共有できる
+_MODEL_CACHE: Dict[str, Tuple[Any, str]] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_torch():
+    """
+    torch を初回使用時に読み込む。
+
+    torch の import は数秒かかるため、アプリ起動（トランスクライバー生成）時ではなく
+    VADモデルのロード（通常はバックグラウンドのプリロード）まで遅延させる。
+    """
+    import torch
+    return torch
+
 
 class VadFilter:
     """
@@ -27,7 +61,7 @@ class VadFilter:
     Attributes:
         min_silence_duration_ms: 無音と判定する最小継続時間（ミリ秒）
         use_cuda: ハードウェアアクセラレーションを使用するかどうか
-        device: 使用デバイス（'mps' / 'cuda' / 'cpu'）
+        device: 使用デバイス（'mps' / 'cuda' / 'cpu'。モデルロード時に決定）
     """
     
     def __init__(
@@ -45,9 +79,10 @@ class VadFilter:
         self.min_silence_duration_ms = min_silence_duration_ms
         self._model = None  # 遅延ロード用
 
-        # デバイス設定: Apple Silicon(MPS)を最優先、次にCUDA、最後にCPU
-        self.device = self._select_device(use_cuda)
-        logger.info(f"VADフィルター初期化 (デバイス: {self.device})")
+        # デバイスは torch の import を伴うため、モデルロード時に選択する
+        self._use_acceleration = use_cuda
+        self.device: Optional[str] = None
+        logger.info(f"VADフィルター初期化 (ハードウェアアクセラレーション: {use_cuda})")
 
     def _select_device(self, use_acceleration: bool) -> str:
         """
@@ -58,6 +93,7 @@ class VadFilter:
         if not use_acceleration:
             return "cpu"
 
+        torch = _get_torch()
         is_macos = platform.system() == "Darwin"
         mps_available = bool(
             hasattr(torch.backends, "mps")
@@ -72,28 +108,110 @@ class VadFilter:
         return "cpu"
 
     def _load_model(self):
-        """Silero VADモデルを遅延ロードする。"""
-        if self._model is None:
+        """
+        Silero VADモデルを遅延ロードする。
+
+        ロード済みモデルはデバイス単位でプロセス全体のキャッシュに保持し、
+        スロット間やホットリロードで再生成された VadFilter から再利用する。
+        """
+        if self._model is not None:
+            return
+
+        # デバイス設定: Apple Silicon(MPS)を最優先、次にCUDA、最後にCPU
+        if self.device is None:
+            self.device = self._select_device(self._use_acceleration)
+
+        requested_device = self.device
+        with _MODEL_CACHE_LOCK:
+            cached = _MODEL_CACHE.get(requested_device)
+            if cached is not None:
+                self._model, self.device = cached
+                logger.debug(f"Silero VADモデルをキャッシュから再利用 ({self.device})")
+                return
+
             try:
                 from silero_vad import load_silero_vad
                 
                 # モデルをロード
-                self._model = load_silero_vad()
+                model = load_silero_vad()
 
                 # デバイスに移動（失敗時はCPUフォールバック）
                 if self.device != "cpu":
                     try:
-                        self._model = self._model.to(self.device)
+                        model = model.to(self.device)
                     except Exception as e:
                         logger.warning(f"VADモデルを{self.device}へ移動できませんでした。CPUへフォールバックします: {e}")
                         self.device = "cpu"
                 
+                self._model = model
+                _MODEL_CACHE[requested_device] = (model, self.device)
                 logger.info(f"Silero VADモデルをロード ({self.device})")
                 
             except Exception as e:
                 logger.error(f"Silero VADモデルのロードに失敗: {e}")
                 raise
     
+    def _get_speech_timestamps(
+        self,
+        audio_data: npt.NDArray[np.float32],
+        sample_rate: int
+    ) -> List[Dict[str, int]]:
+        """
+        発話区間（サンプル単位）を検出する。
+
+        Args:
+            audio_data: 音声データ（float32のNumPy配列）
+            sample_rate: サンプリングレート（Hz）
+
+        Returns:
+            {"start": int, "end": int} 形式の発話区間リスト
+        """
+        from silero_vad import get_speech_timestamps
+
+        torch = _get_torch()
+
+        # NumPy配列をTensorに変換
+        audio_tensor = torch.from_numpy(audio_data)
+        if self.device != "cpu":
+            audio_tensor = audio_tensor.to(self.device)
+
+        # 発話区間を検出
+        with torch.inference_mode():
+            return get_speech_timestamps(
+                audio_tensor,
+                self._model,
+                sampling_rate=sample_rate,
+                min_silence_duration_ms=self.min_silence_duration_ms,
+                return_seconds=False
+            )
+
+    @staticmethod
+    def _passes_energy_gate(audio_data: npt.NDArray[np.float32], sample_rate: int) -> bool:
+        """
+        フレーム毎のエネルギーで「明らかな無音」を安価に判定する。
+
+        最も大きいフレームでも RMS が ENERGY_GATE_SILENCE_DBFS に届かない音声のみ
+        発話なしとみなす。フレーム間の比では判定しない（最初から最後まで発話が続く
+        クリップではノイズフロア自体が発話になり、誤って棄却してしまうため）。
+
+        Args:
+            audio_data: 音声データ（float32のNumPy配列）
+            sample_rate: サンプリングレート（Hz）
+
+        Returns:
+            発話の可能性がある場合True（Silero VAD で判定を続ける）
+        """
+        frame_len = max(1, sample_rate * ENERGY_GATE_FRAME_MS // 1000)
+        num_frames = len(audio_data) // frame_len
+        if num_frames == 0:
+            # 1フレームに満たない短い音声は Silero VAD に委ねる
+            return True
+
+        frames = audio_data[:num_frames * frame_len].reshape(num_frames, frame_len)
+        energy = np.einsum("ij,ij->i", frames, frames)
+        peak_mean_square = float(energy.max()) / frame_len
+        return peak_mean_square >= _ENERGY_GATE_SILENCE_MEAN_SQUARE
+
     def has_speech(self, audio_data: npt.NDArray[np.float32], sample_rate: int = 16000) -> bool:
         """
         音声データに発話が含まれるかを判定する。
@@ -107,28 +225,17 @@ class VadFilter:
         """
         if len(audio_data) == 0:
             return False
+
+        # 明らかな無音は Silero VAD（モデルロード含む）を省略
+        if not self._passes_energy_gate(audio_data, sample_rate):
+            logger.debug("VAD結果: エネルギーゲートで無音と判定")
+            return False
         
         # モデルをロード（未ロードの場合）
         self._load_model()
-            
+
         try:
-            from silero_vad import get_speech_timestamps
-            
-            # NumPy配列をTensorに変換
-            audio_tensor = torch.from_numpy(audio_data)
-            if self.device != "cpu":
-                audio_tensor = audio_tensor.to(self.device)
-            
-            # 発話区間を検出
-            with torch.inference_mode():
-                speech_timestamps = get_speech_timestamps(
-                    audio_tensor,
-                    self._model,
-                    sampling_rate=sample_rate,
-                    min_silence_duration_ms=self.min_silence_duration_ms,
-                    return_seconds=False
-                )
-            
+            speech_timestamps = self._get_speech_timestamps(audio_data, sample_rate)
             has_speech = len(speech_timestamps) > 0
             logger.debug(f"VAD結果: has_speech={has_speech}, セグメント数={len(speech_timestamps)}")
             return has_speech
@@ -138,6 +245,55 @@ class VadFilter:
             # エラー時は安全側に倒してTrueを返す（文字起こしを実行）
             return True
 
+    def trim(
+        self,
+        audio_data: npt.NDArray[np.float32],
+        sample_rate: int = 16000
+    ) -> npt.NDArray[np.float32]:
+        """
+        先頭・末尾の無音区間を切り落とした音声を返す。
+
+        最初の発話開始から最後の発話終了までを TRIM_PADDING_MS の余白付きで残す。
+        発話判定と同じ 1 回の VAD 推論で済むため、has_speech() の代わりに使える。
+
+        Args:
+            audio_data: 音声データ（float32のNumPy配列）
+            sample_rate: サンプリングレート（Hz）
+
+        Returns:
+            トリム後の音声データ（ビュー）。発話が無い場合は空配列
+        """
+        if len(audio_data) == 0:
+            return audio_data
+
+        # 明らかな無音は Silero VAD（モデルロード含む）を省略
+        if not self._passes_energy_gate(audio_data, sample_rate):
+            logger.debug("VAD結果: エネルギーゲートで無音と判定")
+            return audio_data[:0]
+
+        # モデルをロード（未ロードの場合）
+        self._load_model()
+
+        try:
+            speech_timestamps = self._get_speech_timestamps(audio_data, sample_rate)
+        except Exception as e:
+            logger.error(f"VADエラー: {e}")
+            # エラー時は安全側に倒して原音をそのまま返す（文字起こしを実行）
+            return audio_data
+
+        if not speech_timestamps:
+            logger.debug("VAD結果: 発話なし")
+            return audio_data[:0]
+
+        padding = int(sample_rate * TRIM_PADDING_MS / 1000)
+        start = max(0, speech_timestamps[0]["start"] - padding)
+        end = min(len(audio_data), speech_timestamps[-1]["end"] + padding)
+        logger.debug(
+            f"VAD結果: セグメント数={len(speech_timestamps)}, "
+            f"トリム {len(audio_data)} -> {end - start} サンプル"
+        )
+        return audio_data[start:end]
+
     def preload_model(self) -> None:
         """
         VADモデルを事前にロードする。
@@ -78,3 +78,30 @@ class PlatformAdapter(ABC):
             window: 対象ウィンドウ（QWidget 等）
         """
         return None
+
+    # --- 貼り付け・クリップボード（OS ネイティブ API がある場合のみ実体を持つ） ---
+
+    def send_paste_shortcut(self) -> bool:
+        """
+        貼り付けショートカットを OS ネイティブ API で一括送信する。
+
+        修飾キー押下 → V 押下 → V 解放 → 修飾キー解放 を1回の呼び出しで注入する。
+        未対応の OS / 環境では False を返し、呼び出し側は pynput で送信する。
+
+        Returns:
+            送信できた場合 True
+        """
+        return False
+
+    def clipboard_change_count(self) -> Optional[int]:
+        """
+        クリップボードの変更カウンタを返す。
+
+        書き込みのたびに OS が更新する値（Windows: シーケンス番号 /
+        macOS: NSPasteboard の changeCount）。貼り付け前に書き込みの反映を
+        固定時間の sleep ではなくポーリングで確認するために使う。
+
+        Returns:
+            変更カウンタ。取得できない OS / 環境では None
+        """
+        return None
@@ -124,3 +124,12 @@ class MacOSPlatformAdapter(PlatformAdapter):
             NSApp.activateIgnoringOtherApps_(True)
         except Exception as e:
             logger.warning(f"NSApp.activateIgnoringOtherApps_ 失敗: {e}")
+
+    # --- クリップボード（macOS 固有） ---
+
+    def clipboard_change_count(self) -> Optional[int]:
+        try:
+            from AppKit import NSPasteboard  # type: ignore
+            return int(NSPasteboard.generalPasteboard().changeCount())
+        except Exception:
+            return None
@@ -2,7 +2,9 @@
 Windows向けプラットフォーム実装。
 """
 
-from typing import Optional, Sequence
+import ctypes
+from functools import lru_cache
+from typing import Any, Optional, Sequence
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QSystemTrayIcon
@@ -12,6 +14,68 @@ from ..base import PlatformAdapter
 from ..common import normalize_listener_key, qt_key_to_hotkey_token
 
 
+# SendInput 用の定数
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+
+
+@lru_cache(maxsize=1)
+def _build_paste_inputs() -> Optional[Any]:
+    """
+    Ctrl+V の SendInput 用 INPUT[4] 配列と、部分注入時に使うキー解放用 INPUT[2] 配列を1度だけ構築する。
+
+    非Windows環境（GenericPlatformAdapter）では user32 が無いため None を返す。
+    """
+    try:
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+    except (AttributeError, ImportError, OSError, ValueError):
+        return None
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    # INPUT 共用体のサイズを正しくするため、最大メンバーの MOUSEINPUT も定義する
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    def key(vk: int, flags: int = 0) -> INPUT:
+        return INPUT(type=_INPUT_KEYBOARD, u=_INPUTUNION(ki=KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+    inputs = (INPUT * 4)(
+        key(_VK_CONTROL),
+        key(_VK_V),
+        key(_VK_V, _KEYEVENTF_KEYUP),
+        key(_VK_CONTROL, _KEYEVENTF_KEYUP),
+    )
+    release = (INPUT * 2)(
+        key(_VK_V, _KEYEVENTF_KEYUP),
+        key(_VK_CONTROL, _KEYEVENTF_KEYUP),
+    )
+    return user32.SendInput, inputs, release, ctypes.sizeof(INPUT)
+
+
 class WindowsPlatformAdapter(PlatformAdapter):
     """Windows差分実装。"""
 
@@ -78,3 +142,25 @@ class WindowsPlatformAdapter(PlatformAdapter):
 
     def qt_key_to_hotkey_token(self, key: int, scan_code: int = 0) -> str:
         return qt_key_to_hotkey_token(key, scan_code)
+
+    def send_paste_shortcut(self) -> bool:
+        prepared = _build_paste_inputs()
+        if prepared is None:
+            return False
+        send_input, inputs, release, input_size = prepared
+        try:
+            sent = send_input(len(inputs), inputs, input_size)
+            if sent == len(inputs):
+                return True
+            if sent > 0:
+                # 一部のみ注入された場合、Ctrl/V が押されたまま残らないよう解放してからフォールバックさせる
+                send_input(len(release), release, input_size)
+            return False
+        except Exception:
+            return False
+
+    def clipboard_change_count(self) -> Optional[int]:
+        try:
+            return int(ctypes.windll.user32.GetClipboardSequenceNumber())
+        except Exception:
+            return None
@@ -649,7 +649,7 @@ class SettingsWindow(QWidget):
 
         refresh_button = QPushButton("Refresh")
         refresh_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        refresh_button.clicked.connect(self._populate_input_devices)
+        refresh_button.clicked.connect(self._refresh_input_devices)
 
         device_row = QWidget()
         device_row_layout = QHBoxLayout(device_row)
@@ -671,6 +671,11 @@ class SettingsWindow(QWidget):
 
         return page
 
+    def _refresh_input_devices(self) -> None:
+        """デバイス一覧キャッシュを破棄して再列挙する（Refreshボタン用）。"""
+        AudioRecorder.invalidate_device_cache()
+        self._populate_input_devices()
+
     def _populate_input_devices(self) -> None:
         """入力デバイス一覧をコンボボックスへ読み込む。"""
         current_value = "default"
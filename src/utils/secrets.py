@@ -7,7 +7,8 @@ Manager）へ保存・読み出しするための薄いラッパー。`keyring`
 （呼び出し側で環境変数フォールバックを使う想定）。
 """
 
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
 from .logger import get_logger
 
@@ -21,6 +22,13 @@ SERVICE_OPENAI: str = "voicekey.OpenAI"
 # ユーザー名は固定。アプリ単一ユーザー前提のため、エントリ識別はサービス名のみで足りる。
 _USERNAME: str = "default"
 
+# 読み出し結果のキャッシュ（キー: サービス識別子、値: API キーまたは未登録の None）。
+# Keychain / Credential Manager の読み出しは OS への IPC を伴い、文字起こし毎の
+# is_available() で繰り返すと無視できないため、プロセス内で保持する。
+# 本モジュール経由の保存・削除時に更新する（アプリ外での変更は再起動で反映）。
+_key_cache: Dict[str, Optional[str]] = {}
+_key_cache_lock = threading.Lock()
+
 
 # keyring 遅延インポート。テスト環境やヘッドレス Linux で keyring が無いケースでも
 # アプリ起動を阻害しないよう、ImportError は握って機能を縮退させる。
@@ -58,15 +66,20 @@ def get_api_key(service: str) -> Optional[str]:
     """
     if _keyring_module is None:
         return None
+    with _key_cache_lock:
+        if service in _key_cache:
+            return _key_cache[service]
     try:
         value = _keyring_module.get_password(service, _USERNAME)
     except Exception as e:
         # NoKeyringError / KeyringError / OS 認証拒否などをまとめて握る
+        # 一時的な失敗の可能性があるためキャッシュしない
         logger.warning(f"keyring 読み込みに失敗 ({service}): {e}")
         return None
-    if value:
-        return value
-    return None
+    value = value or None
+    with _key_cache_lock:
+        _key_cache[service] = value
+    return value
 
 
 def set_api_key(service: str, key: str) -> bool:
@@ -87,7 +100,11 @@ def set_api_key(service: str, key: str) -> bool:
         _keyring_module.set_password(service, _USERNAME, key)
     except Exception as e:
         logger.warning(f"keyring 書き込みに失敗 ({service}): {e}")
+        with _key_cache_lock:
+            _key_cache.pop(service, None)
         return False
+    with _key_cache_lock:
+        _key_cache[service] = key or None
     return True
 
 
@@ -103,6 +120,9 @@ def delete_api_key(service: str) -> bool:
     """
     if _keyring_module is None:
         return False
+    # 削除の成否によらず次回の読み出しでストアを再確認させる
+    with _key_cache_lock:
+        _key_cache.pop(service, None)
     try:
         _keyring_module.delete_password(service, _USERNAME)
     except Exception as e: